@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+"""Convert a SQLite database written with string ids to the 16-byte UUID schema."""
+
+import argparse
+import os
+import sys
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.storage.legacy import convert_text_ids
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("path", nargs="?", default="investor_memory.db", help="SQLite database file")
+    args = parser.parse_args()
+
+    backup = convert_text_ids(args.path)
+    print(f"Converted {args.path}; the original is kept at {backup}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -45,5 +45,15 @@ async def main():
     print("Done!")
 
 
+def _run(coro):
+    """Run on uvloop when it's installed (via uvicorn[standard]), else asyncio."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        return runner.run(coro)
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    _run(main())
@@ -17,34 +17,44 @@ Phase 2 endpoints:
 - POST /analyze - Analyze text (extract entities, find related)
 """
 
+import asyncio
+import os
 from contextlib import asynccontextmanager
 
 from dotenv import load_dotenv
 load_dotenv()
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
-from uuid import UUID
+from typing import AsyncIterator, Optional
+from uuid import UUID, uuid4
 
-from fastapi import FastAPI, HTTPException
+import orjson
+from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
-from pydantic import BaseModel
+from fastapi.responses import FileResponse, Response, StreamingResponse
+from pydantic import BaseModel, ConfigDict
 
 from src.storage.relational import RelationalStore
 from src.storage.vector import VectorStore, VectorStoreConfig
-from src.embeddings import EmbeddingService
+from src.storage.writer import WriteBatcher
+from src.embeddings import AsyncBatcher, EmbeddingService
 from src.entities.extractor import EntityExtractor
 from src.entities.linker import EntityLinker
 from src.ingestion.pipeline import IngestionPipeline
 from src.search.retriever import Retriever
+from src.search.cache import SemanticQueryCache
 from src.models import SourceType, EntityType
 
 
 # === Request/Response Models ===
 
-class IngestEmailRequest(BaseModel):
+class _RequestModel(BaseModel):
+    """Base for request bodies: validators built at import, immutable once parsed."""
+    model_config = ConfigDict(extra="ignore", frozen=True, defer_build=False)
+
+
+class IngestEmailRequest(_RequestModel):
     subject: str
     body: str
     sender: str
@@ -53,27 +63,27 @@ class IngestEmailRequest(BaseModel):
     thread_id: Optional[str] = None
 
 
-class IngestMeetingRequest(BaseModel):
+class IngestMeetingRequest(_RequestModel):
     title: str
     notes: str
     attendees: list[str]
     timestamp: datetime
 
 
-class IngestDocumentRequest(BaseModel):
+class IngestDocumentRequest(_RequestModel):
     title: str
     content: str
     timestamp: Optional[datetime] = None
 
 
-class IngestTextRequest(BaseModel):
+class IngestTextRequest(_RequestModel):
     text: str
     source_type: str = "document"
     title: Optional[str] = None
     timestamp: Optional[datetime] = None
 
 
-class SearchRequest(BaseModel):
+class SearchRequest(_RequestModel):
     query: str
     limit: int = 10
     company_id: Optional[UUID] = None
@@ -120,7 +130,7 @@ class ExtractedEntityResponse(BaseModel):
     id: Optional[UUID] = None
 
 
-class AnalyzeRequest(BaseModel):
+class AnalyzeRequest(_RequestModel):
     text: str
 
 
@@ -129,14 +139,101 @@ class AnalyzeResponse(BaseModel):
     related_content: list[SearchResultResponse]
 
 
+# Queries shorter than this carry too little signal to be worth embedding
+MIN_QUERY_LENGTH = 3
+# /analyze skips the related-content search for texts shorter than this
+MIN_ANALYZE_LENGTH = 20
+
+# Context views change only on ingest; let clients briefly reuse them
+_CONTEXT_CACHE_CONTROL = "private, max-age=5"
+
+# IngestTextRequest.source_type value -> SourceType
+_SOURCE_MAP = {source_type.value: source_type for source_type in SourceType}
+
+
+def _json_response(content) -> Response:
+    """
+    Serialize plain dicts/lists straight to JSON bytes with orjson.
+
+    Hot read paths build response dicts directly and return them through
+    this, skipping Pydantic response-model validation. The endpoints still
+    declare response_model so the OpenAPI schema is unchanged.
+    """
+    return Response(
+        content=orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY),
+        media_type="application/json",
+    )
+
+
+def _search_results_to_response(results) -> list[dict]:
+    """Build SearchResultResponse-shaped dicts for a list of search results."""
+    return [
+        {
+            "chunk": {
+                "id": chunk.id,
+                "text": chunk.text,
+                "source_type": chunk.source_type.value,
+                "timestamp": chunk.created_at,
+            },
+            "score": sr.score,
+            "company_name": sr.company.name if sr.company else None,
+            "people_names": [p.name for p in sr.people] if sr.people else None,
+        }
+        for sr in results
+        for chunk in (sr.chunk,)
+    ]
+
+
+async def _stream_context(entity_name: str, batches) -> AsyncIterator[bytes]:
+    """
+    Incrementally encode a ContextResponse-shaped JSON document.
+
+    Each batch of results is serialized and sent as soon as it is fetched,
+    so large context views never hold the whole body in memory.
+    """
+    yield b'{"entity_name":' + orjson.dumps(entity_name) + b',"results":['
+    separator = b""
+    async for batch in batches:
+        for item in _search_results_to_response(batch):
+            yield separator + orjson.dumps(item, option=orjson.OPT_SERIALIZE_NUMPY)
+            separator = b","
+    yield b"]}"
+
+
+class HealthShortCircuit:
+    """
+    Raw ASGI middleware answering /health before routing and other middleware.
+
+    Load balancer probes are the most frequent request, so they skip the
+    router, CORS and response serialization entirely.
+    """
+
+    _HEADERS = [(b"content-type", b"application/json"), (b"content-length", b"15")]
+    _BODY = b'{"status":"ok"}'
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"] == "/health":
+            await send({"type": "http.response.start", "status": 200, "headers": self._HEADERS})
+            await send({"type": "http.response.body", "body": self._BODY})
+            return
+        await self.app(scope, receive, send)
+
+
 # === Dependency container ===
 
 class AppState:
     storage: RelationalStore
     vector_store: VectorStore
     embedding_service: EmbeddingService
+    batcher: AsyncBatcher
+    writer: WriteBatcher
+    extractor: EntityExtractor
     pipeline: IngestionPipeline
     retriever: Retriever
+    query_cache: SemanticQueryCache
 
 
 # === App Factory ===
@@ -145,6 +242,10 @@ def create_app() -> FastAPI:
     """Create FastAPI application with all dependencies wired up."""
 
     state = AppState()
+    # Distinguishes ETags across restarts, since entity versions start at 0
+    etag_prefix = uuid4().hex[:8]
+    # Searches currently running, so identical concurrent queries share one
+    inflight_searches: dict[tuple, asyncio.Task] = {}
 
     @asynccontextmanager
     async def lifespan(app: FastAPI):
@@ -152,28 +253,43 @@ def create_app() -> FastAPI:
         state.storage = RelationalStore("sqlite+aiosqlite:///investor_memory.db")
         await state.storage.initialize()
 
-        state.vector_store = VectorStore(VectorStoreConfig(embedding_dimension=384))
-        state.embedding_service = EmbeddingService(backend="local")
-
-        extractor = EntityExtractor()
+        state.embedding_service = EmbeddingService(
+            backend=os.environ.get("EMBEDDING_BACKEND", "local")
+        )
+        # Sized from the service, since the backends differ (384 local, 1536 OpenAI)
+        dimension = state.embedding_service.dimension
+        state.vector_store = VectorStore(VectorStoreConfig(embedding_dimension=dimension))
+        # Concurrent ingest/search requests share batched model calls
+        state.batcher = AsyncBatcher(state.embedding_service)
+
+        state.extractor = EntityExtractor(
+            fast_only=os.environ.get("ENTITY_EXTRACTION", "llm") == "regex"
+        )
         linker = EntityLinker(state.storage)
+        # Concurrent ingests share relational write transactions
+        state.writer = WriteBatcher(state.storage)
 
         state.pipeline = IngestionPipeline(
             storage=state.storage,
-            entity_extractor=extractor,
+            entity_extractor=state.extractor,
             entity_linker=linker,
             vector_store=state.vector_store,
-            embedding_service=state.embedding_service,
+            embedding_service=state.batcher,
+            writer=state.writer,
         )
 
         state.retriever = Retriever(
             storage=state.storage,
             vector_store=state.vector_store,
-            embedding_fn=state.embedding_service.embed,
+            embedding_fn=state.batcher.embed,
+            embedding_batch_fn=state.batcher.embed_batch,
         )
+        state.query_cache = SemanticQueryCache(dimension=dimension)
 
         yield
 
+        await state.batcher.close()
+        await state.writer.close()
         await state.storage.close()
 
     app = FastAPI(
@@ -183,32 +299,66 @@ def create_app() -> FastAPI:
         lifespan=lifespan,
     )
 
-    # Add CORS middleware
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=["*"],
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
-    )
+    # The bundled UI is served from this app, so CORS is only needed for
+    # other origins; skip the middleware (and its per-request cost) otherwise
+    cors_origins = [o.strip() for o in os.environ.get("CORS_ORIGINS", "").split(",") if o.strip()]
+    if cors_origins:
+        app.add_middleware(
+            CORSMiddleware,
+            allow_origins=cors_origins,
+            allow_credentials=True,
+            allow_methods=["*"],
+            allow_headers=["*"],
+        )
+
+    # Added last so it wraps every other middleware
+    app.add_middleware(HealthShortCircuit)
 
     # Mount static files
     static_dir = Path(__file__).parent.parent.parent / "static"
     if static_dir.exists():
         app.mount("/static", StaticFiles(directory=str(static_dir)), name="static")
 
-    def _search_result_to_response(sr) -> SearchResultResponse:
-        return SearchResultResponse(
-            chunk=ChunkResponse(
-                id=sr.chunk.id,
-                text=sr.chunk.text,
-                source_type=sr.chunk.source_type.value,
-                timestamp=sr.chunk.created_at,
-            ),
-            score=sr.score,
-            company_name=sr.company.name if sr.company else None,
-            people_names=[p.name for p in sr.people] if sr.people else None,
+    async def _cached_semantic_search(
+        query: str,
+        limit: int = 10,
+        company_id: Optional[UUID] = None,
+        person_id: Optional[UUID] = None,
+    ):
+        """Semantic search that joins identical in-flight queries and reuses near-identical past ones."""
+        key = (query, limit, company_id, person_id)
+        task = inflight_searches.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                _uncached_semantic_search(query, limit, company_id, person_id)
+            )
+            inflight_searches[key] = task
+            task.add_done_callback(lambda _: inflight_searches.pop(key, None))
+        # Shielded so one client disconnecting doesn't cancel the others' search
+        return await asyncio.shield(task)
+
+    async def _uncached_semantic_search(
+        query: str,
+        limit: int,
+        company_id: Optional[UUID],
+        person_id: Optional[UUID],
+    ):
+        query_embedding = await state.batcher.embed(query)
+        filters = (limit, company_id, person_id)
+        cached = state.query_cache.get(query_embedding, filters)
+        if cached is not None:
+            return cached
+
+        generation = state.query_cache.generation
+        results = await state.retriever.semantic_search(
+            query=query,
+            limit=limit,
+            filter_company_id=company_id,
+            filter_person_id=person_id,
+            query_embedding=query_embedding,
         )
+        state.query_cache.put(query_embedding, filters, results, generation)
+        return results
 
     @app.post("/ingest/email")
     async def ingest_email(request: IngestEmailRequest):
@@ -221,6 +371,7 @@ def create_app() -> FastAPI:
             timestamp=request.timestamp,
             thread_id=request.thread_id,
         )
+        state.query_cache.clear()
         return {"status": "ok", "interaction_id": str(interaction.id)}
 
     @app.post("/ingest/meeting")
@@ -232,6 +383,7 @@ def create_app() -> FastAPI:
             attendees=request.attendees,
             timestamp=request.timestamp,
         )
+        state.query_cache.clear()
         return {"status": "ok", "interaction_id": str(interaction.id)}
 
     @app.post("/ingest/document")
@@ -243,19 +395,13 @@ def create_app() -> FastAPI:
             title=request.title,
             timestamp=request.timestamp,
         )
+        state.query_cache.clear()
         return {"status": "ok", "artifact_id": str(artifact.id)}
 
     @app.post("/ingest/text")
     async def ingest_text(request: IngestTextRequest):
         """Ingest freeform text."""
-        source_map = {
-            "email": SourceType.EMAIL,
-            "meeting_notes": SourceType.MEETING_NOTES,
-            "document": SourceType.DOCUMENT,
-            "newsletter": SourceType.NEWSLETTER,
-            "twitter": SourceType.TWITTER,
-        }
-        source_type = source_map.get(request.source_type, SourceType.DOCUMENT)
+        source_type = _SOURCE_MAP.get(request.source_type, SourceType.DOCUMENT)
 
         artifact = await state.pipeline.ingest_artifact(
             raw_text=request.text,
@@ -263,48 +409,81 @@ def create_app() -> FastAPI:
             title=request.title,
             timestamp=request.timestamp,
         )
+        state.query_cache.clear()
         return {"status": "ok", "artifact_id": str(artifact.id)}
 
-    @app.get("/search")
+    @app.get("/search", response_model=list[SearchResultResponse])
     async def search(
-        query: str,
+        query: str = Query(max_length=2000),
         limit: int = 10,
         company_id: Optional[UUID] = None,
         person_id: Optional[UUID] = None,
-    ) -> list[SearchResultResponse]:
+    ) -> Response:
         """Semantic search over all ingested content."""
-        results = await state.retriever.semantic_search(
+        if len(query.strip()) < MIN_QUERY_LENGTH:
+            return _json_response([])
+
+        results = await _cached_semantic_search(
             query=query,
             limit=limit,
-            filter_company_id=company_id,
-            filter_person_id=person_id,
+            company_id=company_id,
+            person_id=person_id,
         )
-        return [_search_result_to_response(r) for r in results]
+        return _json_response(_search_results_to_response(results))
 
-    @app.get("/company/{company_id}/context")
-    async def get_company_context(company_id: UUID) -> ContextResponse:
+    def _context_etag(entity_id: UUID) -> str:
+        return f'"{etag_prefix}-{entity_id}-{state.pipeline.entity_versions.get(entity_id, 0)}"'
+
+    def _not_modified(request: Request, etag: str) -> Optional[Response]:
+        """Return a 304 if the client already holds the current version."""
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+        return None
+
+    @app.get("/company/{company_id}/context", response_model=ContextResponse)
+    async def get_company_context(
+        company_id: UUID, request: Request, limit: int = 20
+    ) -> Response:
         """Get all past discussions related to a company."""
+        etag = _context_etag(company_id)
+        not_modified = _not_modified(request, etag)
+        if not_modified:
+            return not_modified
+
         company = await state.storage.get_company(company_id)
         if not company:
             raise HTTPException(status_code=404, detail="Company not found")
 
-        results = await state.retriever.search_by_company(company_id)
-        return ContextResponse(
-            entity_name=company.name,
-            results=[_search_result_to_response(r) for r in results],
+        return StreamingResponse(
+            _stream_context(
+                company.name,
+                state.retriever.iter_search_by_company(company_id, limit=limit),
+            ),
+            media_type="application/json",
+            headers={"ETag": etag, "Cache-Control": _CONTEXT_CACHE_CONTROL},
         )
 
-    @app.get("/person/{person_id}/context")
-    async def get_person_context(person_id: UUID) -> ContextResponse:
+    @app.get("/person/{person_id}/context", response_model=ContextResponse)
+    async def get_person_context(
+        person_id: UUID, request: Request, limit: int = 20
+    ) -> Response:
         """Get all interactions involving a person."""
+        etag = _context_etag(person_id)
+        not_modified = _not_modified(request, etag)
+        if not_modified:
+            return not_modified
+
         person = await state.storage.get_person(person_id)
         if not person:
             raise HTTPException(status_code=404, detail="Person not found")
 
-        results = await state.retriever.search_by_person(person_id)
-        return ContextResponse(
-            entity_name=person.name,
-            results=[_search_result_to_response(r) for r in results],
+        return StreamingResponse(
+            _stream_context(
+                person.name,
+                state.retriever.iter_search_by_person(person_id, limit=limit),
+            ),
+            media_type="application/json",
+            headers={"ETag": etag, "Cache-Control": _CONTEXT_CACHE_CONTROL},
         )
 
     @app.post("/admin/seed")
@@ -313,6 +492,7 @@ def create_app() -> FastAPI:
         from src.data.synthetic import SyntheticDataGenerator
         generator = SyntheticDataGenerator()
         count = await generator.seed_database(state.pipeline)
+        state.query_cache.clear()
         return {"status": "ok", "items_seeded": count}
 
     # === Phase 2: Context Viewer UI endpoints ===
@@ -338,84 +518,99 @@ def create_app() -> FastAPI:
     @app.get("/people")
     async def list_people(q: str = "", limit: int = 10) -> list[PersonResponse]:
         """List/search people."""
-        if q:
-            people = await state.storage.search_people_by_name(q, limit=limit)
-        else:
-            people = await state.storage.list_people(limit=limit)
-
-        responses = []
-        for p in people:
-            company_name = None
-            if p.company_id:
-                company = await state.storage.get_company(p.company_id)
-                if company:
-                    company_name = company.name
-            responses.append(PersonResponse(
+        people = await state.storage.list_people_with_company(q, limit=limit)
+        return [
+            PersonResponse(
                 id=p.id,
                 name=p.name,
                 email=p.email,
-                company_name=company_name,
-            ))
-        return responses
+                company_name=c.name if c else None,
+            )
+            for p, c in people
+        ]
 
-    @app.post("/analyze")
-    async def analyze_text(request: AnalyzeRequest) -> AnalyzeResponse:
-        """Analyze text: extract entities and find related content without saving."""
-        # Extract entities
-        extractor = EntityExtractor()
+    async def _resolve_entities(raw_entities) -> list[dict]:
+        """
+        Find existing entities for extracted mentions without creating any.
+
+        Each lookup key (LinkedIn URL, URL/email, then name) is resolved for
+        all mentions at once with a single query, and mentions are matched
+        against the results in priority order.
+        """
+        storage = state.storage
+        companies = [e for e in raw_entities if e.entity_type == EntityType.COMPANY]
+        people = [e for e in raw_entities if e.entity_type != EntityType.COMPANY]
+
+        def _values(entities, key: str) -> list[str]:
+            return list({(e.metadata or {}).get(key) for e in entities} - {None})
+
+        by_company_linkedin, by_url, by_person_linkedin, by_email = await asyncio.gather(
+            storage.get_companies_by_linkedin_urls(_values(companies, "linkedin_url")),
+            storage.get_companies_by_urls(_values(companies, "url")),
+            storage.get_people_by_linkedin_urls(_values(people, "linkedin_url")),
+            storage.get_people_by_emails(_values(people, "email")),
+        )
+        company_keys = [
+            ("linkedin_url", {c.linkedin_url: c for c in by_company_linkedin}),
+            ("url", {c.url: c for c in by_url}),
+        ]
+        person_keys = [
+            ("linkedin_url", {p.linkedin_url: p for p in by_person_linkedin}),
+            ("email", {p.email: p for p in by_email}),
+        ]
 
-        raw_entities = await extractor.extract(request.text)
-        extracted_entities = []
+        def _match_by_key(e, keyed):
+            meta = e.metadata or {}
+            for key, found in keyed:
+                if meta.get(key) in found:
+                    return found[meta[key]]
+            return None
+
+        existing = {id(e): _match_by_key(e, company_keys) for e in companies}
+        existing.update({id(e): _match_by_key(e, person_keys) for e in people})
+
+        # Fuzzy name match as fallback, only for mentions still unresolved
+        companies_by_name, people_by_name = await asyncio.gather(
+            storage.search_companies_by_names([e.text for e in companies if not existing[id(e)]]),
+            storage.search_people_by_names([e.text for e in people if not existing[id(e)]]),
+        )
 
+        resolved = []
         for e in raw_entities:
-            entity_type = "company" if e.entity_type == EntityType.COMPANY else "person"
-            meta = e.metadata or {}
+            is_company = e.entity_type == EntityType.COMPANY
+            entity = existing[id(e)] or (companies_by_name if is_company else people_by_name).get(e.text)
+            resolved.append({
+                "type": "company" if is_company else "person",
+                "name": e.text,
+                "id": entity.id if entity else None,
+            })
+        return resolved
+
+    @app.post("/analyze", response_model=AnalyzeResponse)
+    async def analyze_text(request: AnalyzeRequest) -> Response:
+        """Analyze text: extract entities and find related content without saving."""
+        async def _extract_entities() -> list[dict]:
+            raw_entities = await state.extractor.extract(request.text)
+            return await _resolve_entities(raw_entities)
+
+        async def _find_related() -> list:
+            if len(request.text.strip()) < MIN_ANALYZE_LENGTH:
+                return []
+            return await _cached_semantic_search(
+                query=request.text[:500],  # Use first 500 chars as query
+                limit=10,
+            )
 
-            # Try to find existing entity without creating new ones
-            entity_id = None
-            if entity_type == "company":
-                if meta.get("linkedin_url"):
-                    existing = await state.storage.get_company_by_linkedin(meta["linkedin_url"])
-                    if existing:
-                        entity_id = existing.id
-                if not entity_id and meta.get("url"):
-                    existing = await state.storage.get_company_by_url(meta["url"])
-                    if existing:
-                        entity_id = existing.id
-                if not entity_id:
-                    matches = await state.storage.search_companies_by_name(e.text, limit=1)
-                    if matches:
-                        entity_id = matches[0].id
-            else:  # person
-                if meta.get("linkedin_url"):
-                    existing = await state.storage.get_person_by_linkedin(meta["linkedin_url"])
-                    if existing:
-                        entity_id = existing.id
-                if not entity_id and meta.get("email"):
-                    existing = await state.storage.get_person_by_email(meta["email"])
-                    if existing:
-                        entity_id = existing.id
-                if not entity_id:
-                    matches = await state.storage.search_people_by_name(e.text, limit=1)
-                    if matches:
-                        entity_id = matches[0].id
-
-            extracted_entities.append(ExtractedEntityResponse(
-                type=entity_type,
-                name=e.text,
-                id=entity_id,
-            ))
-
-        # Find related content via semantic search on the input text
-        related = await state.retriever.semantic_search(
-            query=request.text[:500],  # Use first 500 chars as query
-            limit=10,
+        # Entity resolution and the related-content search are independent
+        extracted_entities, related = await asyncio.gather(
+            _extract_entities(),
+            _find_related(),
         )
 
-        return AnalyzeResponse(
-            extracted_entities=extracted_entities,
-            related_content=[_search_result_to_response(r) for r in related],
-        )
+        return _json_response({
+            "extracted_entities": extracted_entities,
+            "related_content": _search_results_to_response(related),
+        })
 
     @app.get("/")
     async def root():
@@ -424,7 +619,7 @@ def create_app() -> FastAPI:
 
     @app.get("/health")
     async def health():
-        """Health check endpoint."""
+        """Health check endpoint (normally answered by HealthShortCircuit)."""
         return {"status": "ok"}
 
     return app
@@ -1,8 +1,11 @@
 """Synthetic data generator for seeding the investor memory system."""
 
+import asyncio
 import random
 from datetime import datetime, timedelta
 
+import numpy as np
+
 from src.ingestion.pipeline import IngestionPipeline
 from src.models import SourceType
 
@@ -42,188 +45,288 @@ PARTNERS = [
 ]
 
 
+# === Document templates (built once; only the variable parts are formatted per item) ===
+
+_INTRO_EMAIL = """\
+Hi team,
+
+Wanted to flag {name} for the group. {founder} ({role}) reached out through our network.
+
+{name} is building {desc}. They're at $2M ARR growing 3x YoY with strong {domain} tailwinds. \
+The team is ex-Google/Stripe with deep domain expertise.
+
+I think this is worth a first meeting. The {domain} space is heating up \
+and their approach to the problem is differentiated.
+
+Best,
+{partner}"""
+
+_REVIEW_EMAIL = """\
+Team,
+
+Circling back on {name} after the deep-dive with {founder}.
+
+Key observations:
+- Strong {first_theme} story: their gross margins are 80%+ and improving
+- {second_theme} is the main discussion point. {founder} has a clear plan \
+but execution risk remains.
+- Customer references were very positive. NPS of 70+.
+- Burn rate is ~$200K/month with 18 months runway.
+
+I'd recommend moving to partner vote. Thoughts?
+
+{partner}"""
+
+_PORTFOLIO_UPDATE = """\
+Hi all,
+
+Quick update from {name}:
+
+- {metrics[0]}
+- {metrics[1]}
+- {metrics[2]}
+
+{founder} is planning to raise a Series B in Q2. They're targeting $20M at a $150M pre.
+
+Overall the trajectory looks strong. The {domain} thesis is playing out well.
+
+Best,
+{partner}"""
+
+_PITCH_NOTES = """\
+Meeting with {founder} ({role}) of {name}
+
+## Company Overview
+{name} is building {desc}.
+Founded 2 years ago. Team of 12.
+
+## Product
+Their core product addresses a real pain point in {domain}. \
+Enterprise SaaS model with land-and-expand motion. \
+Developer tools play a key role in their go-to-market strategy.
+
+## Traction
+- $2M ARR, growing 3x YoY
+- 45 customers including 5 Fortune 500
+- Net retention 130%+
+- Product-market fit feels strong based on usage data
+
+## Concerns
+- TAM concerns: market may be smaller than presented. \
+Total addressable market estimate of $5B seems aggressive.
+- Competitive moat unclear against larger incumbents
+- Burn rate is manageable but unit economics need to improve at scale
+
+## Next Steps
+- Schedule deep-dive with CTO on technical architecture
+- Customer reference calls
+- {partner} to lead diligence
+"""
+
+_DEAL_MEMO = """\
+# {name} - Series A Investment Memo
+
+## Executive Summary
+{name}, led by {founder}, is building {desc}. \
+The company has demonstrated strong product-market fit with $2M ARR growing 3x.
+
+## Investment Thesis
+1. Large and growing market in {domain}
+2. Exceptional founding team with deep domain expertise
+3. Strong unit economics with 80%+ gross margins
+4. Clear competitive moat through technology differentiation
+
+## Key Risks
+1. Execution risk on go-to-market expansion
+2. TAM concerns if adjacent markets don't materialize
+3. Competitive response from incumbents
+
+## Financials
+- Current ARR: $2M
+- Burn rate: $200K/month
+- Runway: 18 months
+- Asking: $15M at $60M pre-money
+
+## Recommendation
+Proceed with $5M investment in the Series A round.
+"""
+
+_REVIEW_THEMES = ["unit economics", "competitive moat", "go-to-market", "product-market fit", "TAM concerns"]
+
+_PORTFOLIO_METRICS = [
+    "ARR grew from $2M to $3.5M this quarter",
+    "Added 15 new enterprise customers",
+    "Net retention at 135%",
+    "Expanded engineering team to 20 people",
+    "Launched new product line targeting mid-market",
+]
+
+
 class SyntheticDataGenerator:
     """Generates synthetic VC-domain data for development and testing."""
 
-    def _random_date(self, days_back: int = 90) -> datetime:
-        return datetime.utcnow() - timedelta(days=random.randint(1, days_back))
+    def __init__(self, seed: int | None = None):
+        self._rng = np.random.default_rng(seed)
+
+    def _random_date(self, days_back: int = 90, now: datetime | None = None) -> datetime:
+        return (now or datetime.utcnow()) - timedelta(days=random.randint(1, days_back))
 
-    def generate_deal_intro_email(self, company: dict, founder: dict) -> dict:
-        partner = random.choice(PARTNERS)
+    def generate_deal_intro_email(
+        self,
+        company: dict,
+        founder: dict,
+        partner: dict | None = None,
+        now: datetime | None = None,
+    ) -> dict:
+        partner = partner or random.choice(PARTNERS)
         return {
             "type": "email",
             "subject": f"Intro: {company['name']} - {company['domain']}",
-            "body": (
-                f"Hi team,\n\n"
-                f"Wanted to flag {company['name']} for the group. {founder['name']} ({founder['role']}) "
-                f"reached out through our network.\n\n"
-                f"{company['name']} is building {company['desc']}. "
-                f"They're at $2M ARR growing 3x YoY with strong {company['domain']} tailwinds. "
-                f"The team is ex-Google/Stripe with deep domain expertise.\n\n"
-                f"I think this is worth a first meeting. The {company['domain']} space is heating up "
-                f"and their approach to the problem is differentiated.\n\n"
-                f"Best,\n{partner['name']}"
+            "body": _INTRO_EMAIL.format(
+                name=company["name"], desc=company["desc"], domain=company["domain"],
+                founder=founder["name"], role=founder["role"], partner=partner["name"],
             ),
             "sender": partner["name"],
             "recipients": ["team@fund.com"],
-            "timestamp": self._random_date(),
+            "timestamp": self._random_date(now=now),
         }
 
-    def generate_deal_review_email(self, company: dict, founder: dict) -> dict:
-        partner = random.choice(PARTNERS)
-        themes = ["unit economics", "competitive moat", "go-to-market", "product-market fit", "TAM concerns"]
-        selected = random.sample(themes, 2)
+    def generate_deal_review_email(
+        self,
+        company: dict,
+        founder: dict,
+        partner: dict | None = None,
+        selected: list[str] | None = None,
+        now: datetime | None = None,
+    ) -> dict:
+        partner = partner or random.choice(PARTNERS)
+        selected = selected or random.sample(_REVIEW_THEMES, 2)
         return {
             "type": "email",
             "subject": f"Re: {company['name']} - Follow-up thoughts",
-            "body": (
-                f"Team,\n\n"
-                f"Circling back on {company['name']} after the deep-dive with {founder['name']}.\n\n"
-                f"Key observations:\n"
-                f"- Strong {selected[0]} story: their gross margins are 80%+ and improving\n"
-                f"- {selected[1].title()} is the main discussion point. {founder['name']} has a clear plan "
-                f"but execution risk remains.\n"
-                f"- Customer references were very positive. NPS of 70+.\n"
-                f"- Burn rate is ~$200K/month with 18 months runway.\n\n"
-                f"I'd recommend moving to partner vote. Thoughts?\n\n"
-                f"{partner['name']}"
+            "body": _REVIEW_EMAIL.format(
+                name=company["name"], founder=founder["name"], partner=partner["name"],
+                first_theme=selected[0], second_theme=selected[1].title(),
             ),
             "sender": partner["name"],
             "recipients": ["team@fund.com"],
-            "timestamp": self._random_date(60),
+            "timestamp": self._random_date(60, now),
         }
 
-    def generate_portfolio_update(self, company: dict, founder: dict) -> dict:
-        metrics = [
-            f"ARR grew from $2M to $3.5M this quarter",
-            f"Added 15 new enterprise customers",
-            f"Net retention at 135%",
-            f"Expanded engineering team to 20 people",
-            f"Launched new product line targeting mid-market",
-        ]
-        selected = random.sample(metrics, 3)
+    def generate_portfolio_update(
+        self,
+        company: dict,
+        founder: dict,
+        selected: list[str] | None = None,
+        now: datetime | None = None,
+    ) -> dict:
+        selected = selected or random.sample(_PORTFOLIO_METRICS, 3)
         return {
             "type": "email",
             "subject": f"{company['name']} Q4 Portfolio Update",
-            "body": (
-                f"Hi all,\n\n"
-                f"Quick update from {company['name']}:\n\n"
-                f"- {selected[0]}\n"
-                f"- {selected[1]}\n"
-                f"- {selected[2]}\n\n"
-                f"{founder['name']} is planning to raise a Series B in Q2. "
-                f"They're targeting $20M at a $150M pre.\n\n"
-                f"Overall the trajectory looks strong. The {company['domain']} thesis "
-                f"is playing out well.\n\n"
-                f"Best,\n{PARTNERS[0]['name']}"
+            "body": _PORTFOLIO_UPDATE.format(
+                name=company["name"], domain=company["domain"], founder=founder["name"],
+                partner=PARTNERS[0]["name"], metrics=selected,
             ),
             "sender": founder["name"],
             "recipients": [PARTNERS[0]["name"]],
-            "timestamp": self._random_date(30),
+            "timestamp": self._random_date(30, now),
         }
 
-    def generate_pitch_meeting_notes(self, company: dict, founder: dict) -> dict:
-        partner = random.choice(PARTNERS)
+    def generate_pitch_meeting_notes(
+        self,
+        company: dict,
+        founder: dict,
+        partner: dict | None = None,
+        now: datetime | None = None,
+    ) -> dict:
+        partner = partner or random.choice(PARTNERS)
         return {
             "type": "meeting",
             "title": f"First Meeting: {company['name']} with {founder['name']}",
-            "notes": (
-                f"Meeting with {founder['name']} ({founder['role']}) of {company['name']}\n\n"
-                f"## Company Overview\n"
-                f"{company['name']} is building {company['desc']}.\n"
-                f"Founded 2 years ago. Team of 12.\n\n"
-                f"## Product\n"
-                f"Their core product addresses a real pain point in {company['domain']}. "
-                f"Enterprise SaaS model with land-and-expand motion. "
-                f"Developer tools play a key role in their go-to-market strategy.\n\n"
-                f"## Traction\n"
-                f"- $2M ARR, growing 3x YoY\n"
-                f"- 45 customers including 5 Fortune 500\n"
-                f"- Net retention 130%+\n"
-                f"- Product-market fit feels strong based on usage data\n\n"
-                f"## Concerns\n"
-                f"- TAM concerns: market may be smaller than presented. "
-                f"Total addressable market estimate of $5B seems aggressive.\n"
-                f"- Competitive moat unclear against larger incumbents\n"
-                f"- Burn rate is manageable but unit economics need to improve at scale\n\n"
-                f"## Next Steps\n"
-                f"- Schedule deep-dive with CTO on technical architecture\n"
-                f"- Customer reference calls\n"
-                f"- {partner['name']} to lead diligence\n"
+            "notes": _PITCH_NOTES.format(
+                name=company["name"], desc=company["desc"], domain=company["domain"],
+                founder=founder["name"], role=founder["role"], partner=partner["name"],
             ),
             "attendees": [partner["name"], founder["name"]],
-            "timestamp": self._random_date(45),
+            "timestamp": self._random_date(45, now),
         }
 
-    def generate_deal_memo(self, company: dict, founder: dict) -> dict:
+    def generate_deal_memo(self, company: dict, founder: dict, now: datetime | None = None) -> dict:
         return {
             "type": "document",
             "title": f"Deal Memo: {company['name']} Series A",
-            "content": (
-                f"# {company['name']} - Series A Investment Memo\n\n"
-                f"## Executive Summary\n"
-                f"{company['name']}, led by {founder['name']}, is building {company['desc']}. "
-                f"The company has demonstrated strong product-market fit with $2M ARR growing 3x.\n\n"
-                f"## Investment Thesis\n"
-                f"1. Large and growing market in {company['domain']}\n"
-                f"2. Exceptional founding team with deep domain expertise\n"
-                f"3. Strong unit economics with 80%+ gross margins\n"
-                f"4. Clear competitive moat through technology differentiation\n\n"
-                f"## Key Risks\n"
-                f"1. Execution risk on go-to-market expansion\n"
-                f"2. TAM concerns if adjacent markets don't materialize\n"
-                f"3. Competitive response from incumbents\n\n"
-                f"## Financials\n"
-                f"- Current ARR: $2M\n"
-                f"- Burn rate: $200K/month\n"
-                f"- Runway: 18 months\n"
-                f"- Asking: $15M at $60M pre-money\n\n"
-                f"## Recommendation\n"
-                f"Proceed with $5M investment in the Series A round.\n"
+            "content": _DEAL_MEMO.format(
+                name=company["name"], desc=company["desc"], domain=company["domain"],
+                founder=founder["name"],
             ),
-            "timestamp": self._random_date(30),
+            "timestamp": self._random_date(30, now),
         }
 
     def generate_all(self) -> list[dict]:
         """Generate a full set of synthetic data items."""
+        # Draw every partner/theme/metric choice up front in a few vector calls
+        n = len(COMPANIES)
+        now = datetime.utcnow()
+        partner_ix = self._rng.integers(0, len(PARTNERS), size=(n, 3))
+        theme_ix = self._rng.permuted(np.tile(np.arange(len(_REVIEW_THEMES)), (n, 1)), axis=1)[:, :2]
+        metric_ix = self._rng.permuted(np.tile(np.arange(len(_PORTFOLIO_METRICS)), (n, 1)), axis=1)[:, :3]
+
         items = []
         for i, company in enumerate(COMPANIES):
             founder = FOUNDERS[i]
-            items.append(self.generate_deal_intro_email(company, founder))
-            items.append(self.generate_deal_review_email(company, founder))
-            items.append(self.generate_portfolio_update(company, founder))
-            items.append(self.generate_pitch_meeting_notes(company, founder))
-            items.append(self.generate_deal_memo(company, founder))
+            partners = [PARTNERS[j] for j in partner_ix[i]]
+            items.append(self.generate_deal_intro_email(company, founder, partner=partners[0], now=now))
+            items.append(self.generate_deal_review_email(
+                company, founder,
+                partner=partners[1],
+                selected=[_REVIEW_THEMES[j] for j in theme_ix[i]],
+                now=now,
+            ))
+            items.append(self.generate_portfolio_update(
+                company, founder,
+                selected=[_PORTFOLIO_METRICS[j] for j in metric_ix[i]],
+                now=now,
+            ))
+            items.append(self.generate_pitch_meeting_notes(company, founder, partner=partners[2], now=now))
+            items.append(self.generate_deal_memo(company, founder, now=now))
         return items
 
-    async def seed_database(self, pipeline: IngestionPipeline) -> int:
-        """Seed the database with synthetic data via the ingestion pipeline."""
+    async def seed_database(self, pipeline: IngestionPipeline, concurrency: int = 8) -> int:
+        """
+        Seed the database with synthetic data via the ingestion pipeline.
+
+        Items are ingested concurrently (at most `concurrency` at a time) so
+        embedding calls from different items can share batches.
+        """
         items = self.generate_all()
-        count = 0
-
-        for item in items:
-            if item["type"] == "email":
-                await pipeline.ingest_email(
-                    subject=item["subject"],
-                    body=item["body"],
-                    sender=item["sender"],
-                    recipients=item["recipients"],
-                    timestamp=item["timestamp"],
-                )
-            elif item["type"] == "meeting":
-                await pipeline.ingest_meeting_notes(
-                    notes=item["notes"],
-                    meeting_title=item["title"],
-                    attendees=item["attendees"],
-                    timestamp=item["timestamp"],
-                )
-            elif item["type"] == "document":
-                await pipeline.ingest_artifact(
-                    raw_text=item["content"],
-                    source_type=SourceType.DOCUMENT,
-                    title=item["title"],
-                    timestamp=item["timestamp"],
-                )
-            count += 1
-
-        return count
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _ingest(item: dict) -> None:
+            async with semaphore:
+                if item["type"] == "email":
+                    await pipeline.ingest_email(
+                        subject=item["subject"],
+                        body=item["body"],
+                        sender=item["sender"],
+                        recipients=item["recipients"],
+                        timestamp=item["timestamp"],
+                    )
+                elif item["type"] == "meeting":
+                    await pipeline.ingest_meeting_notes(
+                        notes=item["notes"],
+                        meeting_title=item["title"],
+                        attendees=item["attendees"],
+                        timestamp=item["timestamp"],
+                    )
+                elif item["type"] == "document":
+                    await pipeline.ingest_artifact(
+                        raw_text=item["content"],
+                        source_type=SourceType.DOCUMENT,
+                        title=item["title"],
+                        timestamp=item["timestamp"],
+                    )
+
+        async with pipeline.bulk():
+            await asyncio.gather(*(_ingest(item) for item in items))
+        return len(items)
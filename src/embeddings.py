@@ -1,70 +1,227 @@
 """Embedding service wrapping sentence-transformers for local dev, swappable to OpenAI."""
 
 import asyncio
+import contextvars
+import hashlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Literal
 
-from sentence_transformers import SentenceTransformer
+import numpy as np
+from openai import AsyncOpenAI
+
+# Normalized components lie in [-1, 1]; map them onto the symmetric int8 range
+INT8_SCALE = 127
+
+
+def quantize_int8(embedding) -> np.ndarray:
+    """Quantize a normalized embedding to int8 (4x smaller than fp32)."""
+    scaled = np.round(np.asarray(embedding, dtype=np.float32) * INT8_SCALE)
+    return np.clip(scaled, -INT8_SCALE, INT8_SCALE).astype(np.int8)
+
+
+def int8_similarity(matrix: np.ndarray, query: np.ndarray) -> np.ndarray:
+    """Approximate cosine similarity between int8 vectors (rows of `matrix`) and `query`."""
+    return (matrix.astype(np.int32) @ query.astype(np.int32)) / INT8_SCALE**2
 
 
 class EmbeddingService:
     """
     Embedding service with a local sentence-transformers backend.
 
-    Uses all-MiniLM-L6-v2 (384-dim) for dev. Set backend="openai" and provide
-    an api_key to use OpenAI ada-002 (1536-dim) in production.
+    Uses all-MiniLM-L6-v2 (384-dim) for dev, in fp16 when running on a
+    GPU. Set backend="onnx" to run the same model through ONNX Runtime
+    with int8-quantized weights (requires sentence-transformers[onnx] >=
+    3.2). Set backend="openai" and provide an api_key to use OpenAI
+    ada-002 (1536-dim) in production.
     """
 
     def __init__(
         self,
-        backend: Literal["local", "openai"] = "local",
+        backend: Literal["local", "onnx", "openai"] = "local",
         model_name: str = "sentence-transformers/all-MiniLM-L6-v2",
         api_key: str | None = None,
+        onnx_file_name: str = "onnx/model_quint8_avx2.onnx",
+        batch_size: int = 64,
+        openai_chunk_size: int = 96,
+        cache_size: int = 10_000,
     ):
         self.backend = backend
         self.model_name = model_name
+        self.batch_size = batch_size
         self._model = None
-        self._api_key = api_key
+        self._client = None
+        self._executor = None
+        self.openai_chunk_size = openai_chunk_size
+        # LRU of vectors keyed by content hash, so re-ingested chunks skip the model
+        self.cache_size = cache_size
+        self._cache: OrderedDict[bytes, np.ndarray] = OrderedDict()
+
+        if backend in ("local", "onnx"):
+            # Imported lazily: it pulls in torch, which the openai backend never needs
+            from sentence_transformers import SentenceTransformer
+            # One dedicated inference thread: the model already uses every
+            # core via intra-op threads, and encodes mustn't queue behind
+            # (or tie up) the default executor used for Chroma calls
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="embed")
 
         if backend == "local":
             self._model = SentenceTransformer(model_name)
+            # fp16 halves memory traffic on GPU; CPU inference stays fp32
+            if self._model.device.type == "cuda":
+                self._model.half()
+            self.dimension = self._model.get_sentence_embedding_dimension()
+        elif backend == "onnx":
+            # Pre-quantized int8 export shipped in the model repo
+            self._model = SentenceTransformer(
+                model_name,
+                backend="onnx",
+                model_kwargs={"file_name": onnx_file_name},
+            )
             self.dimension = self._model.get_sentence_embedding_dimension()
         elif backend == "openai":
+            self._client = AsyncOpenAI(api_key=api_key)
             self.dimension = 1536
         else:
             raise ValueError(f"Unknown backend: {backend}")
 
-    async def embed(self, text: str) -> list[float]:
-        """Embed a single text string."""
-        if self.backend == "local":
-            # Run in executor to avoid blocking the event loop
-            loop = asyncio.get_event_loop()
-            embedding = await loop.run_in_executor(
-                None, lambda: self._model.encode(text, normalize_embeddings=True)
-            )
-            return embedding.tolist()
-        elif self.backend == "openai":
-            return await self._embed_openai([text])[0]
+    async def embed(self, text: str) -> np.ndarray:
+        """Embed a single text string as a float32 vector."""
+        return (await self.embed_batch([text]))[0]
 
-    async def embed_batch(self, texts: list[str]) -> list[list[float]]:
-        """Embed a batch of texts."""
+    async def embed_batch(self, texts: list[str]) -> list[np.ndarray]:
+        """Embed a batch of texts, one float32 vector (a row view) per text."""
         if not texts:
             return []
 
-        if self.backend == "local":
-            loop = asyncio.get_event_loop()
+        keys = [hashlib.blake2b(t.encode(), digest_size=16).digest() for t in texts]
+        results = [self._cache.get(key) for key in keys]
+        # Repeated texts within the batch are encoded once
+        missing = {key: text for key, text, r in zip(keys, texts, results) if r is None}
+        if missing:
+            encoded = dict(zip(missing, await self._encode(list(missing.values()))))
+            for key, embedding in encoded.items():
+                self._cache[key] = embedding
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+            results = [encoded[key] if r is None else r for key, r in zip(keys, results)]
+        for key in keys:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+        return results
+
+    async def _encode(self, texts: list[str]) -> list[np.ndarray]:
+        if self.backend in ("local", "onnx"):
+            loop = asyncio.get_running_loop()
             embeddings = await loop.run_in_executor(
-                None, lambda: self._model.encode(texts, normalize_embeddings=True)
+                self._executor,
+                lambda: self._model.encode(
+                    texts, batch_size=self.batch_size, normalize_embeddings=True
+                ),
             )
-            return [e.tolist() for e in embeddings]
+            return list(embeddings)
         elif self.backend == "openai":
             return await self._embed_openai(texts)
 
-    async def _embed_openai(self, texts: list[str]) -> list[list[float]]:
-        """Embed using OpenAI API."""
-        import openai
-        client = openai.AsyncOpenAI(api_key=self._api_key)
-        response = await client.embeddings.create(
-            model="text-embedding-ada-002",
-            input=texts,
-        )
-        return [item.embedding for item in response.data]
+    async def embed_int8(self, text: str) -> bytes:
+        """Embed a single text string as packed int8 bytes (384 B for MiniLM)."""
+        return quantize_int8(await self.embed(text)).tobytes()
+
+    async def _embed_openai(self, texts: list[str]) -> list[np.ndarray]:
+        """Embed using OpenAI API, sending large batches as concurrent chunked requests."""
+        responses = await asyncio.gather(*(
+            self._client.embeddings.create(
+                model="text-embedding-ada-002",
+                input=texts[i : i + self.openai_chunk_size],
+            )
+            for i in range(0, len(texts), self.openai_chunk_size)
+        ))
+        return [
+            np.asarray(item.embedding, dtype=np.float32)
+            for response in responses
+            for item in response.data
+        ]
+
+
+class AsyncBatcher:
+    """
+    Coalesces concurrent embedding requests into batched model calls.
+
+    Requests are queued and a background worker drains up to `max_batch`
+    texts (waiting at most `window_ms` after the first one arrives) into a
+    single `embed_batch` call. Exposes the same `embed`/`embed_batch`
+    interface as EmbeddingService so it can be used anywhere the service is.
+    """
+
+    def __init__(
+        self,
+        service: EmbeddingService,
+        max_batch: int = 32,
+        window_ms: float = 5.0,
+    ):
+        self.service = service
+        self.dimension = service.dimension
+        self.max_batch = max_batch
+        self.window = window_ms / 1000
+        self._queue: asyncio.Queue | None = None
+        self._worker: asyncio.Task | None = None
+
+    async def embed(self, text: str) -> np.ndarray:
+        """Embed a single text string via the shared batch queue."""
+        return (await self.embed_batch([text]))[0]
+
+    async def embed_batch(self, texts: list[str]) -> list[np.ndarray]:
+        """Embed a batch of texts, sharing model calls with concurrent callers."""
+        if not texts:
+            return []
+
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        if self._worker is None or self._worker.done():
+            # Fresh context, so the long-lived worker doesn't carry the
+            # first caller's context variables into every later batch
+            self._worker = asyncio.create_task(self._run(), context=contextvars.Context())
+
+        loop = asyncio.get_running_loop()
+        futures = []
+        for text in texts:
+            future = loop.create_future()
+            self._queue.put_nowait((text, future))
+            futures.append(future)
+        return list(await asyncio.gather(*futures))
+
+    async def close(self) -> None:
+        """Stop the background worker."""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.window
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                embeddings = await self.service.embed_batch([text for text, _ in batch])
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (_, future), embedding in zip(batch, embeddings):
+                if not future.done():
+                    future.set_result(embedding)
@@ -1,14 +1,19 @@
-import json
+import asyncio
+import hashlib
 import os
 import re
+from collections import OrderedDict
 from dataclasses import dataclass
+from functools import lru_cache
 
+import ahocorasick
+import orjson
 from openai import AsyncOpenAI
 
 from src.models import EntityType
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractedEntity:
     """An entity extracted from text, before linking."""
     text: str  # The mention as it appears in text
@@ -23,8 +28,11 @@ class ExtractedEntity:
 URL_PATTERN = re.compile(
     r'https?://(?:www\.)?([a-zA-Z0-9-]+(?:\.[a-zA-Z]{2,})+)(?:/[^\s]*)?'
 )
+# The lookbehind only lets a match start at the beginning of a run of
+# local-part characters; otherwise every offset inside a long token is
+# retried, which is quadratic in the token length
 EMAIL_PATTERN = re.compile(
-    r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
+    r'(?<![a-zA-Z0-9._%+-])[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
 )
 LINKEDIN_COMPANY_PATTERN = re.compile(
     r'linkedin\.com/company/([a-zA-Z0-9-]+)'
@@ -32,6 +40,19 @@ LINKEDIN_COMPANY_PATTERN = re.compile(
 LINKEDIN_PERSON_PATTERN = re.compile(
     r'linkedin\.com/in/([a-zA-Z0-9-]+)'
 )
+# Domains whose URLs don't identify a company
+SKIP_DOMAINS = frozenset({"linkedin.com", "google.com", "gmail.com", "github.com", "twitter.com", "x.com"})
+# Splits an email local part ("sarah.chen") into name parts
+NAME_SPLIT_PATTERN = re.compile(r'[._]')
+# Company and person names are capitalized, so text without a capital has none
+UPPERCASE_PATTERN = re.compile(r'[A-Z]')
+
+
+@lru_cache(maxsize=4096)
+def _slug_to_name(slug: str) -> str:
+    """Display name for a LinkedIn slug ("sarah-chen" -> "Sarah Chen"); slugs recur across chunks."""
+    return slug.replace("-", " ").title()
+
 
 EXTRACTION_PROMPT = """\
 Extract all company names and person names mentioned in the following text.
@@ -58,14 +79,36 @@ class EntityExtractor:
     Extracts entities (companies and people) from text.
 
     Uses OpenAI GPT-4o-mini for NER + regex for URLs/emails/LinkedIn.
+    With `fast_only`, the LLM is skipped and only the regex passes run,
+    which suits high-volume backfills.
     """
 
-    def __init__(self, api_key: str | None = None, model: str = "gpt-4o-mini"):
+    def __init__(
+        self,
+        api_key: str | None = None,
+        model: str = "gpt-4o-mini",
+        cache_size: int = 1024,
+        fast_only: bool = False,
+        max_window_chars: int = 12_000,
+    ):
         self.client = AsyncOpenAI(api_key=api_key or os.environ.get("OPENAI_API_KEY"))
         self.model = model
+        self.fast_only = fast_only
+        # Longest text sent in one LLM call; longer documents are split so
+        # neither the prompt nor the JSON reply outgrows the model's limits
+        self.max_window_chars = max_window_chars
+        # LRU of LLM results keyed by content hash, so repeated texts skip the API
+        self.cache_size = cache_size
+        self._cache: OrderedDict[bytes, tuple[list[str], list[str]]] = OrderedDict()
 
     async def _extract_with_llm(self, text: str) -> tuple[list[str], list[str]]:
         """Call the LLM to extract company and person names from text."""
+        key = hashlib.blake2b(text.encode(), digest_size=16).digest()
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
+
         response = await self.client.chat.completions.create(
             model=self.model,
             messages=[
@@ -78,8 +121,10 @@ class EntityExtractor:
 
         raw = response.choices[0].message.content
         try:
-            parsed = json.loads(raw)
-        except (json.JSONDecodeError, TypeError):
+            parsed = orjson.loads(raw)
+        except (orjson.JSONDecodeError, TypeError):
+            return [], []
+        if not isinstance(parsed, dict):
             return [], []
 
         companies = parsed.get("companies", [])
@@ -91,75 +136,167 @@ class EntityExtractor:
         if not isinstance(people, list):
             people = []
 
-        return (
+        result = (
             [c for c in companies if isinstance(c, str) and c.strip()],
             [p for p in people if isinstance(p, str) and p.strip()],
         )
+        self._cache[key] = result
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return result
+
+    async def _extract_names(self, text: str) -> tuple[list[str], list[str]]:
+        """LLM company/person names for text, skipping the call when there is nothing to find."""
+        if self.fast_only:
+            return [], []
+        # Non-ASCII text is always sent, as it may use scripts without letter case
+        if text.strip() and (not text.isascii() or UPPERCASE_PATTERN.search(text)):
+            return await self._extract_with_llm(text)
+        return [], []
 
     async def extract(self, text: str) -> list[ExtractedEntity]:
         """Extract all entities (companies and people) from text."""
         # LLM-based extraction for unstructured text
-        llm_companies, llm_people = await self._extract_with_llm(text)
+        llm_companies, llm_people = await self._extract_names(text)
+        return self._build_entities(text, llm_companies, llm_people)
+
+    async def extract_many(self, texts: list[str]) -> list[list[ExtractedEntity]]:
+        """
+        Extract entities from several texts concurrently, once per distinct text.
+
+        For batches of unrelated texts; the pipeline uses extract_document,
+        but this stays public for callers outside it.
+        """
+        unique = list(dict.fromkeys(texts))
+        results = dict(zip(unique, await asyncio.gather(*(self.extract(t) for t in unique))))
+        return [results[t] for t in texts]
+
+    async def extract_document(self, text: str, chunks: list[str]) -> list[list[ExtractedEntity]]:
+        """
+        Extract entities for every chunk of a document with a single LLM call.
+
+        The LLM reads the whole document once; each chunk then gets the names
+        that occur in it plus its own regex matches. Names the LLM normalized
+        beyond recognition (found nowhere in the text) go to the first chunk.
+        Documents longer than `max_window_chars` are sent as consecutive
+        windows of chunks, one call each, and their names merged.
+        """
+        if len(text) <= self.max_window_chars:
+            llm_companies, llm_people = await self._extract_names(text)
+        else:
+            windows = await asyncio.gather(*(
+                self._extract_names(window) for window in self._windows(chunks)
+            ))
+            llm_companies = list(dict.fromkeys(n for companies, _ in windows for n in companies))
+            llm_people = list(dict.fromkeys(n for _, people in windows for n in people))
+        all_names = [name.lower() for name in llm_companies + llm_people]
+        located = self._locate_names(text.lower(), all_names)
+        unlocated = {name for name in all_names if name not in located}
+
+        return [
+            self._build_entities(chunk, llm_companies, llm_people, keep_unlocated=unlocated if i == 0 else set())
+            for i, chunk in enumerate(chunks)
+        ]
+
+    def _windows(self, chunks: list[str]) -> list[str]:
+        """Group consecutive chunks into texts of at most max_window_chars (a longer chunk stands alone)."""
+        windows: list[str] = []
+        current: list[str] = []
+        size = 0
+        for chunk in chunks:
+            if current and size + len(chunk) > self.max_window_chars:
+                windows.append("\n\n".join(current))
+                current, size = [], 0
+            current.append(chunk)
+            size += len(chunk) + 2
+        if current:
+            windows.append("\n\n".join(current))
+        return windows
+
+    def _build_entities(
+        self,
+        text: str,
+        llm_companies: list[str],
+        llm_people: list[str],
+        keep_unlocated: set[str] | None = None,
+    ) -> list[ExtractedEntity]:
+        """
+        Turn LLM names into positioned entities and add regex matches.
+
+        Names not found in `text` are kept at (0, 0) unless `keep_unlocated`
+        is given, in which case only the (lowercased) names in it are kept.
+        """
+        # Lowercase each LLM name once and drop repeats (companies win over
+        # people on a clash), keeping first-seen order
+        candidates: dict[str, tuple[str, EntityType]] = {}
+        for names, entity_type in ((llm_companies, EntityType.COMPANY), (llm_people, EntityType.PERSON)):
+            for name in names:
+                candidates.setdefault(name.lower(), (name, entity_type))
+        positions = self._locate_names(text.lower(), list(candidates))
+        if keep_unlocated is not None:
+            candidates = {
+                name_lower: candidate
+                for name_lower, candidate in candidates.items()
+                if name_lower in positions or name_lower in keep_unlocated
+            }
+        seen_names: set[str] = set(candidates)
 
         entities: list[ExtractedEntity] = []
-        seen_names: set[str] = set()
-
-        # Add LLM-extracted companies
-        for name in llm_companies:
-            name_lower = name.lower()
-            if name_lower not in seen_names:
-                seen_names.add(name_lower)
-                # Find position in text if possible
-                start = text.lower().find(name_lower)
-                end = start + len(name) if start >= 0 else 0
-                start = max(start, 0)
-                entities.append(ExtractedEntity(
-                    text=name,
-                    entity_type=EntityType.COMPANY,
-                    start_pos=start,
-                    end_pos=end,
-                    confidence=0.9,
-                ))
-
-        # Add LLM-extracted people
-        for name in llm_people:
-            name_lower = name.lower()
-            if name_lower not in seen_names:
-                seen_names.add(name_lower)
-                start = text.lower().find(name_lower)
-                end = start + len(name) if start >= 0 else 0
-                start = max(start, 0)
-                entities.append(ExtractedEntity(
-                    text=name,
-                    entity_type=EntityType.PERSON,
-                    start_pos=start,
-                    end_pos=end,
-                    confidence=0.9,
-                ))
-
-        # Regex-based extraction for structured data (URLs, emails, LinkedIn)
-        entities.extend(self._extract_from_urls(text, seen_names))
-        entities.extend(self._extract_from_emails(text, seen_names))
-        entities.extend(self._extract_from_linkedin(text, seen_names))
+        for name_lower, (name, entity_type) in candidates.items():
+            # Find position in text if possible
+            start = positions.get(name_lower, -1)
+            end = start + len(name) if start >= 0 else 0
+            entities.append(ExtractedEntity(
+                text=name,
+                entity_type=entity_type,
+                start_pos=max(start, 0),
+                end_pos=end,
+                confidence=0.9,
+            ))
+
+        # Regex-based extraction for structured data (URLs, emails, LinkedIn).
+        # Each pattern needs a literal anchor, and a substring check for it is
+        # much cheaper than a regex pass over text that cannot match.
+        if "http" in text:
+            entities.extend(self._extract_from_urls(text, seen_names))
+        if "@" in text:
+            entities.extend(self._extract_from_emails(text, seen_names))
+        if "linkedin.com/" in text:
+            entities.extend(self._extract_from_linkedin(text, seen_names))
 
         return entities
 
+    @staticmethod
+    def _locate_names(text_lower: str, names_lower: list[str]) -> dict[str, int]:
+        """Find the first offset of every name with one Aho-Corasick pass over the text."""
+        if not names_lower:
+            return {}
+        automaton = ahocorasick.Automaton()
+        for name in names_lower:
+            automaton.add_word(name, name)
+        automaton.make_automaton()
+
+        # Matches arrive ordered by end offset, so the first hit per name is its earliest
+        positions: dict[str, int] = {}
+        for end_index, name in automaton.iter(text_lower):
+            positions.setdefault(name, end_index - len(name) + 1)
+        return positions
+
     @staticmethod
     def _extract_from_urls(text: str, seen_names: set[str]) -> list[ExtractedEntity]:
         """Extract company entities from URLs."""
         entities = []
-        skip_domains = {"linkedin.com", "google.com", "gmail.com", "github.com", "twitter.com", "x.com"}
 
         for match in URL_PATTERN.finditer(text):
             url = match.group(0)
-            domain = match.group(1)
-            base_domain = ".".join(domain.split(".")[-2:])
-            if base_domain in skip_domains:
+            labels = match.group(1).split(".")
+            if ".".join(labels[-2:]) in SKIP_DOMAINS:
                 continue
 
-            company_name = domain.split(".")[0].title()
-            if company_name.lower() not in seen_names:
-                seen_names.add(company_name.lower())
+            company_name = labels[0].title()
+            name_lower = company_name.lower()
+            if name_lower not in seen_names:
+                seen_names.add(name_lower)
                 entities.append(ExtractedEntity(
                     text=company_name,
                     entity_type=EntityType.COMPANY,
@@ -177,10 +314,11 @@ class EntityExtractor:
         for match in EMAIL_PATTERN.finditer(text):
             email = match.group(0)
             local_part = email.split("@")[0]
-            name_parts = re.split(r'[._]', local_part)
-            name = " ".join(p.title() for p in name_parts if len(p) > 1)
-            if name and name.lower() not in seen_names:
-                seen_names.add(name.lower())
+            name_parts = NAME_SPLIT_PATTERN.split(local_part)
+            name = " ".join([p.title() for p in name_parts if len(p) > 1])
+            name_lower = name.lower()
+            if name and name_lower not in seen_names:
+                seen_names.add(name_lower)
                 entities.append(ExtractedEntity(
                     text=name,
                     entity_type=EntityType.PERSON,
@@ -198,10 +336,11 @@ class EntityExtractor:
 
         for match in LINKEDIN_COMPANY_PATTERN.finditer(text):
             slug = match.group(1)
-            name = slug.replace("-", " ").title()
+            name = _slug_to_name(slug)
             linkedin_url = f"https://www.linkedin.com/company/{slug}"
-            if name.lower() not in seen_names:
-                seen_names.add(name.lower())
+            name_lower = name.lower()
+            if name_lower not in seen_names:
+                seen_names.add(name_lower)
                 entities.append(ExtractedEntity(
                     text=name,
                     entity_type=EntityType.COMPANY,
@@ -213,10 +352,11 @@ class EntityExtractor:
 
         for match in LINKEDIN_PERSON_PATTERN.finditer(text):
             slug = match.group(1)
-            name = slug.replace("-", " ").title()
+            name = _slug_to_name(slug)
             linkedin_url = f"https://www.linkedin.com/in/{slug}"
-            if name.lower() not in seen_names:
-                seen_names.add(name.lower())
+            name_lower = name.lower()
+            if name_lower not in seen_names:
+                seen_names.add(name_lower)
                 entities.append(ExtractedEntity(
                     text=name,
                     entity_type=EntityType.PERSON,
@@ -1,3 +1,4 @@
+import asyncio
 from typing import Optional
 from uuid import UUID
 
@@ -14,10 +15,14 @@ class EntityLinker:
     - Deduplication (same entity mentioned different ways)
     - Normalization (LinkedIn URL as canonical ID)
     - Creating new entities when no match found
+
+    Lookup-then-create is serialized with a lock so concurrent ingests
+    mentioning the same entity don't both create it.
     """
 
     def __init__(self, storage: StorageBackend):
         self.storage = storage
+        self._lock = asyncio.Lock()
 
     async def link_entity(self, extracted: ExtractedEntity) -> Entity:
         """
@@ -43,6 +48,104 @@ class EntityLinker:
         else:
             raise ValueError(f"Unknown entity type: {extracted.entity_type}")
 
+    async def link_entities_bulk(self, extracted: list[ExtractedEntity]) -> list[Entity]:
+        """
+        Link many mentions at once, returning one entity per mention, in order.
+
+        Every LinkedIn URL, URL/email and name is looked up with a single
+        storage query per key type, mentions are resolved in memory with the
+        same priority as link_company/link_person, and unmatched ones are
+        inserted in one batch. The result is the same as linking the mentions
+        one by one: a later mention can match an entity created for an
+        earlier one.
+        """
+        for ext in extracted:
+            if ext.entity_type not in (EntityType.COMPANY, EntityType.PERSON):
+                raise ValueError(f"Unknown entity type: {ext.entity_type}")
+
+        companies = [e for e in extracted if e.entity_type == EntityType.COMPANY]
+        people = [e for e in extracted if e.entity_type == EntityType.PERSON]
+
+        async with self._lock:
+            linked_companies = await self._link_bulk(
+                companies,
+                lookups=[
+                    ("linkedin_url", self.storage.get_companies_by_linkedin_urls),
+                    ("url", self.storage.get_companies_by_urls),
+                ],
+                search_by_names=self.storage.search_companies_by_names,
+                create=lambda name, meta: Company(
+                    name=name, url=meta.get("url"), linkedin_url=meta.get("linkedin_url")
+                ),
+                save_many=self.storage.save_companies,
+            )
+            linked_people = await self._link_bulk(
+                people,
+                lookups=[
+                    ("linkedin_url", self.storage.get_people_by_linkedin_urls),
+                    ("email", self.storage.get_people_by_emails),
+                ],
+                search_by_names=self.storage.search_people_by_names,
+                create=lambda name, meta: Person(
+                    name=name, email=meta.get("email"), linkedin_url=meta.get("linkedin_url")
+                ),
+                save_many=self.storage.save_people,
+            )
+
+        by_mention = dict(zip(map(id, companies), linked_companies))
+        by_mention.update(zip(map(id, people), linked_people))
+        return [by_mention[id(ext)] for ext in extracted]
+
+    @staticmethod
+    async def _link_bulk(mentions, lookups, search_by_names, create, save_many) -> list:
+        metas = [m.metadata or {} for m in mentions]
+
+        # Existing entities, one query per identifier type
+        existing: dict[str, dict] = {}
+        for field, get_many in lookups:
+            values = list({meta[field] for meta in metas if meta.get(field)})
+            existing[field] = {getattr(e, field): e for e in await get_many(values)}
+
+        def _by_identifier(meta, index):
+            for field, _ in lookups:
+                value = meta.get(field)
+                if value and value in index[field]:
+                    return index[field][value]
+            return None
+
+        unresolved = [m.text for m, meta in zip(mentions, metas) if not _by_identifier(meta, existing)]
+        existing_by_name = await search_by_names(unresolved)
+
+        # Entities created earlier in this batch, indexed like storage would be
+        created: list = []
+        created_index: dict[str, dict] = {field: {} for field, _ in lookups}
+        linked = []
+        for mention, meta in zip(mentions, metas):
+            # Identifiers beat names, whether the match is stored or new
+            entity = None
+            for field, _ in lookups:
+                value = meta.get(field)
+                if value:
+                    entity = existing[field].get(value) or created_index[field].get(value)
+                    if entity:
+                        break
+            if entity is None:
+                needle = mention.text.lower()
+                entity = existing_by_name.get(mention.text) or next(
+                    (e for e in created if needle in e.name.lower()), None
+                )
+            if entity is None:
+                entity = create(mention.text, meta)
+                created.append(entity)
+                for field, _ in lookups:
+                    value = getattr(entity, field)
+                    if value:
+                        created_index[field].setdefault(value, entity)
+            linked.append(entity)
+
+        await save_many(created)
+        return linked
+
     async def link_company(
         self,
         name: str,
@@ -50,6 +153,15 @@ class EntityLinker:
         linkedin_url: Optional[str] = None,
     ) -> Company:
         """Link or create a company entity."""
+        async with self._lock:
+            return await self._link_company(name, url, linkedin_url)
+
+    async def _link_company(
+        self,
+        name: str,
+        url: Optional[str],
+        linkedin_url: Optional[str],
+    ) -> Company:
         # Prefer LinkedIn URL for matching, then domain URL
         if linkedin_url:
             existing = await self.storage.get_company_by_linkedin(linkedin_url)
@@ -78,6 +190,15 @@ class EntityLinker:
         linkedin_url: Optional[str] = None,
     ) -> Person:
         """Link or create a person entity."""
+        async with self._lock:
+            return await self._link_person(name, email, linkedin_url)
+
+    async def _link_person(
+        self,
+        name: str,
+        email: Optional[str],
+        linkedin_url: Optional[str],
+    ) -> Person:
         if linkedin_url:
             existing = await self.storage.get_person_by_linkedin(linkedin_url)
             if existing:
@@ -1,16 +1,42 @@
+import asyncio
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from typing import AsyncIterator, Optional
 from uuid import UUID
 
-from src.models import Interaction, Artifact, Chunk, SourceType
+from src.models import Interaction, Artifact, Chunk, Entity, EntityType, SourceType
 from src.ingestion.chunker import TextChunker
-from src.entities.extractor import EntityExtractor
+from src.entities.extractor import EntityExtractor, ExtractedEntity
 from src.entities.linker import EntityLinker
 from src.storage.base import StorageBackend
 from src.storage.vector import VectorStore
+from src.storage.writer import WriteBatcher
 from src.embeddings import EmbeddingService
 
 
+def _link_key(ext: ExtractedEntity) -> tuple:
+    """Identity of a mention for linking: its strongest identifier, else its name."""
+    meta = ext.metadata or {}
+    identifier = meta.get("linkedin_url") or meta.get("url") or meta.get("email")
+    return (ext.entity_type, identifier or ext.text.lower())
+
+
+@dataclass
+class BulkOptions:
+    """Tuning for bulk ingestion (see IngestionPipeline.bulk)."""
+    batch_size: int = 500  # Chunks buffered before each write
+
+
+@dataclass(slots=True)
+class _BulkBuffer:
+    """Chunks awaiting a write in one bulk() block."""
+    options: BulkOptions
+    chunks: list[Chunk] = field(default_factory=list)
+
+
 class IngestionPipeline:
     """
     Main ingestion pipeline for Phase 1.
@@ -32,13 +58,49 @@ class IngestionPipeline:
         vector_store: VectorStore,
         embedding_service: EmbeddingService,
         chunker: Optional[TextChunker] = None,
+        writer: Optional[WriteBatcher] = None,
     ):
         self.storage = storage
+        # Interaction and chunk writes go through the writer when given, so
+        # concurrent ingests share transactions
+        self.writer = writer or storage
         self.entity_extractor = entity_extractor
         self.entity_linker = entity_linker
         self.vector_store = vector_store
         self.embedding_service = embedding_service
         self.chunker = chunker or TextChunker()
+        # Bumped whenever a new chunk is linked to an entity; lets readers
+        # cheaply tell whether an entity's context has changed
+        self.entity_versions: defaultdict[UUID, int] = defaultdict(int)
+        # Buffer of the enclosing bulk() block, if any. Context-local, so
+        # only ingests awaited inside the block are buffered, not ones
+        # running concurrently in other requests
+        self._bulk: ContextVar[Optional[_BulkBuffer]] = ContextVar(
+            f"ingestion_pipeline_bulk_{id(self)}", default=None
+        )
+
+    @asynccontextmanager
+    async def bulk(self, options: Optional[BulkOptions] = None) -> AsyncIterator[None]:
+        """
+        Buffer chunk writes across many ingests and flush them in batches.
+
+        For corpus loads and backfills. Inside the block, chunks are written
+        `batch_size` at a time with one executemany per table and one vector
+        upsert, and the remainder on exit. Chunks aren't searchable until
+        their batch has been flushed. Only ingests awaited inside the block
+        (including tasks it starts) are buffered; other callers of the same
+        pipeline write as usual.
+        """
+        if self._bulk.get() is not None:
+            raise RuntimeError("Bulk ingestion is already active")
+        buffer = _BulkBuffer(options or BulkOptions())
+        token = self._bulk.set(buffer)
+        try:
+            yield
+        finally:
+            self._bulk.reset(token)
+            buffered, buffer.chunks = buffer.chunks, []
+            await self._write_chunks(buffered)
 
     async def ingest_interaction(
         self,
@@ -50,14 +112,15 @@ class IngestionPipeline:
     ) -> Interaction:
         """Ingest an interaction (email, meeting notes, etc.)."""
         # 1. Resolve participant names to Person entities
-        participant_ids = []
-        if participants:
-            for name in participants:
-                # Skip raw email addresses — they aren't useful person names
-                if "@" in name:
-                    continue
-                person = await self.entity_linker.link_person(name=name)
-                participant_ids.append(person.id)
+        # Skip raw email addresses — they aren't useful person names
+        mentions = [
+            ExtractedEntity(text=name, entity_type=EntityType.PERSON, start_pos=0, end_pos=0)
+            for name in participants or []
+            if "@" not in name
+        ]
+        participant_ids = [
+            person.id for person in await self.entity_linker.link_entities_bulk(mentions)
+        ] if mentions else []
 
         # 2. Create Interaction object
         interaction = Interaction(
@@ -67,39 +130,11 @@ class IngestionPipeline:
             participants=participant_ids,
             metadata=metadata or {},
         )
-        await self.storage.save_interaction(interaction)
+        await self.writer.save_interaction(interaction)
 
-        # 3. Chunk the text
+        # 3. Chunk the text, then extract, link, embed, and store each chunk
         chunk_texts = self.chunker.chunk_text(raw_text)
-
-        # 4. Extract entities from each chunk, link, embed, and store
-        all_chunk_texts = chunk_texts
-        embeddings = await self.embedding_service.embed_batch(all_chunk_texts)
-
-        for i, chunk_text in enumerate(all_chunk_texts):
-            # Extract entities from this chunk
-            extracted = await self.entity_extractor.extract(chunk_text)
-
-            # Link extracted entities to canonical entities
-            entity_ids = []
-            for ext in extracted:
-                linked = await self.entity_linker.link_entity(ext)
-                if linked.id not in entity_ids:
-                    entity_ids.append(linked.id)
-
-            # Create chunk
-            chunk = Chunk(
-                text=chunk_text,
-                source_id=interaction.id,
-                source_type=source_type,
-                entity_ids=entity_ids,
-                embedding=embeddings[i],
-                metadata=metadata or {},
-            )
-
-            # 5. Store in relational DB and vector store
-            await self.storage.save_chunk(chunk)
-            await self.vector_store.upsert(chunk)
+        await self._ingest_chunks(raw_text, chunk_texts, interaction.id, source_type, metadata)
 
         return interaction
 
@@ -123,28 +158,79 @@ class IngestionPipeline:
 
         # Chunk, extract, embed, store
         chunk_texts = self.chunker.chunk_text(raw_text)
-        embeddings = await self.embedding_service.embed_batch(chunk_texts)
+        await self._ingest_chunks(raw_text, chunk_texts, artifact.id, source_type, metadata)
+
+        return artifact
+
+    async def _ingest_chunks(
+        self,
+        raw_text: str,
+        chunk_texts: list[str],
+        source_id: UUID,
+        source_type: SourceType,
+        metadata: Optional[dict],
+    ) -> None:
+        """
+        Extract, link, embed, and store the chunks of one source.
+
+        Entities are extracted from the whole text with one LLM call and
+        assigned to the chunks they occur in. That call and the embedding
+        batch don't depend on each other, so they run concurrently. Distinct
+        mentions are then linked in one bulk call, and the relational and
+        vector writes run concurrently.
+        """
+        embeddings, extractions = await asyncio.gather(
+            self.embedding_service.embed_batch(chunk_texts),
+            self.entity_extractor.extract_document(raw_text, chunk_texts),
+        )
 
-        for i, chunk_text in enumerate(chunk_texts):
-            extracted = await self.entity_extractor.extract(chunk_text)
-            entity_ids = []
-            for ext in extracted:
-                linked = await self.entity_linker.link_entity(ext)
-                if linked.id not in entity_ids:
-                    entity_ids.append(linked.id)
+        # Overlapping chunks repeat most mentions; link each distinct one
+        # once, all in a single bulk call
+        mentions: dict[tuple, ExtractedEntity] = {}
+        for ext in (ext for extracted in extractions for ext in extracted):
+            mentions.setdefault(_link_key(ext), ext)
+        linked: dict[tuple, Entity] = dict(zip(
+            mentions, await self.entity_linker.link_entities_bulk(list(mentions.values()))
+        ))
 
-            chunk = Chunk(
+        chunks = []
+        for chunk_text, embedding, extracted in zip(chunk_texts, embeddings, extractions):
+            # Keyed by id, so duplicates collapse while keeping first-mention order
+            entity_types = {
+                entity.id: entity.entity_type
+                for entity in (linked[_link_key(ext)] for ext in extracted)
+            }
+            chunks.append(Chunk(
                 text=chunk_text,
-                source_id=artifact.id,
+                source_id=source_id,
                 source_type=source_type,
-                entity_ids=entity_ids,
-                embedding=embeddings[i],
+                entity_ids=list(entity_types),
+                entity_types=entity_types,
+                embedding=embedding,
                 metadata=metadata or {},
-            )
-            await self.storage.save_chunk(chunk)
-            await self.vector_store.upsert(chunk)
+            ))
 
-        return artifact
+        buffer = self._bulk.get()
+        if buffer is not None:
+            buffer.chunks.extend(chunks)
+            if len(buffer.chunks) >= buffer.options.batch_size:
+                batch, buffer.chunks = buffer.chunks, []
+                await self._write_chunks(batch)
+            return
+        await self._write_chunks(chunks)
+
+    async def _write_chunks(self, chunks: list[Chunk]) -> None:
+        if not chunks:
+            return
+        # Store in relational DB and vector store; the vector batch is written
+        # from a worker thread while the relational rows go in
+        await asyncio.gather(
+            self.writer.save_chunks(chunks),
+            self.vector_store.upsert_many(chunks),
+        )
+        for chunk in chunks:
+            for eid in chunk.entity_ids:
+                self.entity_versions[eid] += 1
 
     async def ingest_email(
         self,
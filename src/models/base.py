@@ -4,6 +4,8 @@ from enum import Enum
 from typing import Optional
 from uuid import UUID, uuid4
 
+import numpy as np
+
 
 class SourceType(Enum):
     EMAIL = "email"
@@ -19,7 +21,7 @@ class EntityType(Enum):
     THEME = "theme"
 
 
-@dataclass
+@dataclass(slots=True)
 class Entity:
     """Base class for extracted entities."""
     id: UUID = field(default_factory=uuid4)
@@ -28,7 +30,7 @@ class Entity:
     created_at: datetime = field(default_factory=datetime.utcnow)
 
 
-@dataclass
+@dataclass(slots=True)
 class Company(Entity):
     """A company entity, normalized by URL or LinkedIn URL."""
     entity_type: EntityType = field(default=EntityType.COMPANY, init=False)
@@ -37,7 +39,7 @@ class Company(Entity):
     description: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Person(Entity):
     """A person entity, normalized by LinkedIn URL."""
     entity_type: EntityType = field(default=EntityType.PERSON, init=False)
@@ -46,14 +48,14 @@ class Person(Entity):
     company_id: Optional[UUID] = None  # Link to associated company
 
 
-@dataclass
+@dataclass(slots=True)
 class Theme(Entity):
     """An investment theme or pattern."""
     entity_type: EntityType = field(default=EntityType.THEME, init=False)
     keywords: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Interaction:
     """A conversation or interaction (email, meeting, etc.)."""
     id: UUID = field(default_factory=uuid4)
@@ -65,7 +67,7 @@ class Interaction:
     created_at: datetime = field(default_factory=datetime.utcnow)
 
 
-@dataclass
+@dataclass(slots=True)
 class Artifact:
     """A document or artifact (deck, memo, etc.)."""
     id: UUID = field(default_factory=uuid4)
@@ -78,7 +80,7 @@ class Artifact:
     created_at: datetime = field(default_factory=datetime.utcnow)
 
 
-@dataclass
+@dataclass(slots=True)
 class Chunk:
     """A text chunk for embedding and retrieval."""
     id: UUID = field(default_factory=uuid4)
@@ -86,6 +88,7 @@ class Chunk:
     source_id: UUID = field(default_factory=uuid4)  # Interaction or Artifact ID
     source_type: SourceType = SourceType.EMAIL
     entity_ids: list[UUID] = field(default_factory=list)  # Linked entities
-    embedding: Optional[list[float]] = None
+    entity_types: dict[UUID, EntityType] = field(default_factory=dict)  # Known types of entity_ids
+    embedding: Optional[np.ndarray] = None
     metadata: dict = field(default_factory=dict)
     created_at: datetime = field(default_factory=datetime.utcnow)
@@ -1,3 +1,4 @@
 from .retriever import Retriever
+from .cache import SemanticQueryCache
 
-__all__ = ["Retriever"]
+__all__ = ["Retriever", "SemanticQueryCache"]
@@ -0,0 +1,100 @@
+from collections import OrderedDict
+from typing import Hashable, Optional
+
+import numpy as np
+
+from src.embeddings import int8_similarity, quantize_int8
+
+
+class SemanticQueryCache:
+    """
+    In-process cache of search results keyed by query embedding.
+
+    A lookup hits when a cached query embedding has cosine similarity above
+    `threshold` with the new one and was searched with identical filters,
+    so paraphrased repeats skip the vector store and enrichment entirely.
+    Embeddings are assumed normalized (EmbeddingService normalizes), which
+    makes the inner product equal to cosine similarity. Embeddings are
+    held as int8, a quarter of the fp32 footprint, at a similarity error
+    well below the gap between the threshold and 1.0.
+    """
+
+    def __init__(
+        self,
+        dimension: int = 384,
+        threshold: float = 0.95,
+        max_size: int = 5000,
+    ):
+        self.threshold = threshold
+        self.max_size = max_size
+        # Fixed-size slot matrix; evicted slots are reused in place
+        self._matrix = np.zeros((max_size, dimension), dtype=np.int8)
+        self._filters: list[Hashable] = [None] * max_size
+        self._results: list[Optional[list]] = [None] * max_size
+        self._lru: OrderedDict[int, None] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        # Bumped by clear(); lets a search that began before a clear skip
+        # caching its now-stale results
+        self.generation = 0
+
+    def __len__(self) -> int:
+        return len(self._lru)
+
+    def get(self, embedding: np.ndarray, filters: Hashable) -> Optional[list]:
+        """Return cached results for a near-identical query, or None."""
+        if not self._lru:
+            self.misses += 1
+            return None
+
+        scores = int8_similarity(self._matrix[: len(self._lru)], quantize_int8(embedding))
+        best_slot = None
+        best_score = self.threshold
+        for slot in np.flatnonzero(scores >= self.threshold):
+            if self._filters[slot] == filters and scores[slot] >= best_score:
+                best_slot, best_score = int(slot), scores[slot]
+
+        if best_slot is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._lru.move_to_end(best_slot)
+        return self._results[best_slot]
+
+    def put(
+        self,
+        embedding: np.ndarray,
+        filters: Hashable,
+        results: list,
+        generation: Optional[int] = None,
+    ) -> None:
+        """
+        Cache results for a query, evicting the least recently used entry if full.
+
+        Pass the `generation` read before the search ran; if the cache has
+        been cleared since, the results may predate new content and are
+        dropped.
+        """
+        if generation is not None and generation != self.generation:
+            return
+        if len(self._lru) >= self.max_size:
+            slot, _ = self._lru.popitem(last=False)
+        else:
+            slot = len(self._lru)
+
+        self._matrix[slot] = quantize_int8(embedding)
+        self._filters[slot] = filters
+        self._results[slot] = results
+        self._lru[slot] = None
+
+    def stats(self) -> dict:
+        """Entry count and hit/miss counters since creation."""
+        return {"size": len(self._lru), "hits": self.hits, "misses": self.misses}
+
+    def clear(self) -> None:
+        """Drop all entries (call after ingesting new content)."""
+        self.generation += 1
+        self._matrix[:] = 0
+        self._filters = [None] * self.max_size
+        self._results = [None] * self.max_size
+        self._lru.clear()
@@ -1,8 +1,11 @@
+import asyncio
 from dataclasses import dataclass
-from typing import Optional
+from typing import AsyncIterator, Optional
 from uuid import UUID
 
-from src.models import Chunk, Company, Person
+import numpy as np
+
+from src.models import Chunk, Company, Entity, EntityType, Person
 from src.storage.base import StorageBackend
 from src.storage.vector import VectorStore, VectorSearchResult
 
@@ -30,10 +33,12 @@ class Retriever:
         storage: StorageBackend,
         vector_store: VectorStore,
         embedding_fn=None,  # Function to embed text
+        embedding_batch_fn=None,  # Optional: embeds a list of texts in one call
     ):
         self.storage = storage
         self.vector_store = vector_store
         self.embedding_fn = embedding_fn
+        self.embedding_batch_fn = embedding_batch_fn
 
     async def search_by_company(
         self,
@@ -41,8 +46,11 @@ class Retriever:
         limit: int = 20,
     ) -> list[SearchResult]:
         """Find all content related to a company."""
-        chunks = await self.storage.get_chunks_by_entity(company_id, limit=limit)
-        company = await self.storage.get_company(company_id)
+        # Independent reads; each gets its own pooled connection
+        chunks, company = await asyncio.gather(
+            self.storage.get_chunks_by_entity(company_id, limit=limit),
+            self.storage.get_company(company_id),
+        )
 
         results = []
         for chunk in chunks:
@@ -59,8 +67,10 @@ class Retriever:
         limit: int = 20,
     ) -> list[SearchResult]:
         """Find all content involving a person."""
-        chunks = await self.storage.get_chunks_by_entity(person_id, limit=limit)
-        person = await self.storage.get_person(person_id)
+        chunks, person = await asyncio.gather(
+            self.storage.get_chunks_by_entity(person_id, limit=limit),
+            self.storage.get_person(person_id),
+        )
 
         results = []
         for chunk in chunks:
@@ -71,40 +81,130 @@ class Retriever:
             ))
         return results
 
+    async def iter_search_by_company(
+        self,
+        company_id: UUID,
+        limit: int = 20,
+        batch_size: int = 200,
+    ) -> AsyncIterator[list[SearchResult]]:
+        """Like search_by_company, but yields results in batches of `batch_size`."""
+        company = await self.storage.get_company(company_id)
+        async for chunks in self._iter_entity_chunks(company_id, limit, batch_size):
+            yield [SearchResult(chunk=c, score=1.0, company=company) for c in chunks]
+
+    async def iter_search_by_person(
+        self,
+        person_id: UUID,
+        limit: int = 20,
+        batch_size: int = 200,
+    ) -> AsyncIterator[list[SearchResult]]:
+        """Like search_by_person, but yields results in batches of `batch_size`."""
+        person = await self.storage.get_person(person_id)
+        people = [person] if person else None
+        async for chunks in self._iter_entity_chunks(person_id, limit, batch_size):
+            yield [SearchResult(chunk=c, score=1.0, people=people) for c in chunks]
+
+    async def _iter_entity_chunks(
+        self, entity_id: UUID, limit: int, batch_size: int
+    ) -> AsyncIterator[list]:
+        # Each page is its own storage call, so no session is held open
+        # while the caller consumes a batch
+        offset = 0
+        while offset < limit:
+            page_size = min(batch_size, limit - offset)
+            chunks = await self.storage.get_chunks_by_entity(
+                entity_id, limit=page_size, offset=offset
+            )
+            if chunks:
+                yield chunks
+            if len(chunks) < page_size:
+                return
+            offset += page_size
+
     async def semantic_search(
         self,
         query: str,
         limit: int = 10,
         filter_company_id: Optional[UUID] = None,
         filter_person_id: Optional[UUID] = None,
+        query_embedding: Optional[np.ndarray] = None,
     ) -> list[SearchResult]:
         """
         Semantic search over all content.
 
-        Optionally filter by entity.
+        Optionally filter by entity. Pass `query_embedding` if the caller
+        has already embedded the query.
+        """
+        if query_embedding is None:
+            if self.embedding_fn is None:
+                raise ValueError("No embedding function configured")
+            query_embedding = await self.embedding_fn(query)
+
+        return await self._search_embedding(
+            query_embedding, limit, self._filter_ids(filter_company_id, filter_person_id)
+        )
+
+    async def semantic_search_many(
+        self,
+        queries: list[str],
+        limit: int = 10,
+        filter_company_id: Optional[UUID] = None,
+        filter_person_id: Optional[UUID] = None,
+    ) -> list[list[SearchResult]]:
+        """
+        Run several semantic searches, returning one result list per query.
+
+        All queries are embedded in one batch (when `embedding_batch_fn` is
+        configured) and searched concurrently.
         """
-        if self.embedding_fn is None:
+        if not queries:
+            return []
+        if self.embedding_batch_fn is not None:
+            embeddings = await self.embedding_batch_fn(queries)
+        elif self.embedding_fn is not None:
+            embeddings = await asyncio.gather(*(self.embedding_fn(q) for q in queries))
+        else:
             raise ValueError("No embedding function configured")
 
-        # Embed query
-        query_embedding = await self.embedding_fn(query)
+        filter_ids = self._filter_ids(filter_company_id, filter_person_id)
+        return list(await asyncio.gather(
+            *(self._search_embedding(e, limit, filter_ids) for e in embeddings)
+        ))
 
-        # Build entity filter
-        filter_ids = []
-        if filter_company_id:
-            filter_ids.append(filter_company_id)
-        if filter_person_id:
-            filter_ids.append(filter_person_id)
+    @staticmethod
+    def _filter_ids(
+        filter_company_id: Optional[UUID], filter_person_id: Optional[UUID]
+    ) -> Optional[list[UUID]]:
+        filter_ids = [eid for eid in (filter_company_id, filter_person_id) if eid]
+        return filter_ids or None
 
+    async def _search_embedding(
+        self,
+        query_embedding: np.ndarray,
+        limit: int,
+        filter_ids: Optional[list[UUID]],
+    ) -> list[SearchResult]:
         # Search vector store
         results = await self.vector_store.search(
             query_embedding=query_embedding,
             limit=limit,
-            filter_entity_ids=filter_ids if filter_ids else None,
+            filter_entity_ids=filter_ids,
         )
 
-        # Enrich with context
-        return [await self._enrich_result(r) for r in results]
+        # Enrich with context, resolving every referenced entity in one fetch.
+        # Themes aren't part of a result, so ids known to be themes are skipped.
+        entity_types = {}
+        for r in results:
+            entity_types.update(r.chunk.entity_types)
+        entity_ids = {
+            eid for r in results for eid in r.chunk.entity_ids
+            if entity_types.get(eid) != EntityType.THEME
+        }
+        entities = (
+            await self.storage.get_entities_bulk(list(entity_ids), entity_types)
+            if entity_ids else {}
+        )
+        return [self._enrich_result(r, entities) for r in results]
 
     async def find_related(
         self,
@@ -118,21 +218,22 @@ class Retriever:
         """
         return await self.semantic_search(query=query, limit=limit)
 
-    async def _enrich_result(self, result: VectorSearchResult) -> SearchResult:
-        """Add entity context to a search result."""
+    @staticmethod
+    def _enrich_result(
+        result: VectorSearchResult, entities: dict[UUID, Entity]
+    ) -> SearchResult:
+        """Add entity context to a search result from pre-fetched entities."""
         chunk = result.chunk
 
         company = None
         people = []
 
         for entity_id in chunk.entity_ids:
-            c = await self.storage.get_company(entity_id)
-            if c:
-                company = c
-                continue
-            p = await self.storage.get_person(entity_id)
-            if p:
-                people.append(p)
+            entity = entities.get(entity_id)
+            if isinstance(entity, Company):
+                company = entity
+            elif isinstance(entity, Person):
+                people.append(entity)
 
         return SearchResult(
             chunk=chunk,
@@ -1,5 +1,6 @@
 from .base import StorageBackend
 from .vector import VectorStore
 from .relational import RelationalStore
+from .writer import WriteBatcher
 
-__all__ = ["StorageBackend", "VectorStore", "RelationalStore"]
+__all__ = ["StorageBackend", "VectorStore", "RelationalStore", "WriteBatcher"]
@@ -4,7 +4,7 @@ from uuid import UUID
 
 from src.models import (
     Interaction, Artifact, Chunk,
-    Company, Person, Theme, Entity
+    Company, Person, Theme, Entity, EntityType
 )
 
 
@@ -17,6 +17,10 @@ class StorageBackend(ABC):
     - Semantic search (vector)
     """
 
+    def in_transaction(self) -> bool:
+        """Whether the calling task is inside a transaction block (none by default)."""
+        return False
+
     # === Interactions ===
 
     @abstractmethod
@@ -24,6 +28,11 @@ class StorageBackend(ABC):
         """Save an interaction."""
         pass
 
+    @abstractmethod
+    async def save_interactions(self, interactions: list[Interaction], batch_size: int = 500) -> None:
+        """Upsert many interactions and their participants in one transaction."""
+        pass
+
     @abstractmethod
     async def get_interaction(self, id: UUID) -> Optional[Interaction]:
         """Get interaction by ID."""
@@ -55,6 +64,11 @@ class StorageBackend(ABC):
         """Save a chunk with its embedding."""
         pass
 
+    @abstractmethod
+    async def save_chunks(self, chunks: list[Chunk], batch_size: int = 500) -> None:
+        """Upsert many chunks and their entity links in one transaction."""
+        pass
+
     @abstractmethod
     async def get_chunks_by_source(self, source_id: UUID) -> list[Chunk]:
         """Get all chunks from a source."""
@@ -84,6 +98,26 @@ class StorageBackend(ABC):
     ) -> list[Company]:
         pass
 
+    @abstractmethod
+    async def save_companies(self, companies: list[Company]) -> None:
+        """Save several new companies in one transaction."""
+        pass
+
+    @abstractmethod
+    async def get_companies_by_linkedin_urls(self, linkedin_urls: list[str]) -> list[Company]:
+        """Get all companies with any of the given LinkedIn URLs in one query."""
+        pass
+
+    @abstractmethod
+    async def get_companies_by_urls(self, urls: list[str]) -> list[Company]:
+        """Get all companies with any of the given URLs in one query."""
+        pass
+
+    @abstractmethod
+    async def search_companies_by_names(self, names: list[str]) -> dict[str, Company]:
+        """Map each name to its best match, as search_companies_by_name(name, limit=1) would."""
+        pass
+
     @abstractmethod
     async def save_person(self, person: Person) -> None:
         pass
@@ -106,6 +140,26 @@ class StorageBackend(ABC):
     ) -> list[Person]:
         pass
 
+    @abstractmethod
+    async def save_people(self, people: list[Person]) -> None:
+        """Save several new people in one transaction."""
+        pass
+
+    @abstractmethod
+    async def get_people_by_linkedin_urls(self, linkedin_urls: list[str]) -> list[Person]:
+        """Get all people with any of the given LinkedIn URLs in one query."""
+        pass
+
+    @abstractmethod
+    async def get_people_by_emails(self, emails: list[str]) -> list[Person]:
+        """Get all people with any of the given emails in one query."""
+        pass
+
+    @abstractmethod
+    async def search_people_by_names(self, names: list[str]) -> dict[str, Person]:
+        """Map each name to its best match, as search_people_by_name(name, limit=1) would."""
+        pass
+
     @abstractmethod
     async def save_theme(self, theme: Theme) -> None:
         pass
@@ -120,6 +174,22 @@ class StorageBackend(ABC):
         pass
 
     @abstractmethod
-    async def get_chunks_by_entity(self, entity_id: UUID, limit: int = 50) -> list[Chunk]:
-        """Get all chunks linked to a specific entity."""
+    async def get_entities_bulk(
+        self,
+        ids: list[UUID],
+        entity_types: Optional[dict[UUID, EntityType]] = None,
+    ) -> dict[UUID, Entity]:
+        """
+        Resolve companies, people and themes by id in one round-trip per table.
+
+        Ids with a known type in `entity_types` are only looked up in that
+        type's table.
+        """
+        pass
+
+    @abstractmethod
+    async def get_chunks_by_entity(
+        self, entity_id: UUID, limit: int = 50, offset: int = 0
+    ) -> list[Chunk]:
+        """Get chunks linked to a specific entity, in stable order for paging."""
         pass
@@ -0,0 +1,88 @@
+"""One-off conversion of SQLite databases written before ids became 16-byte UUIDs."""
+
+import asyncio
+import os
+import sqlite3
+from pathlib import Path
+from uuid import UUID
+
+from sqlalchemy import String, inspect
+
+from src.storage.models import Base, UUIDType
+
+
+class LegacySchemaError(RuntimeError):
+    """The database still stores ids as 36-character strings."""
+
+
+def has_text_ids(sync_conn) -> bool:
+    """Whether an existing schema predates UUIDType (ids declared as VARCHAR)."""
+    inspector = inspect(sync_conn)
+    if not inspector.has_table("companies"):
+        return False
+    id_column = next(c for c in inspector.get_columns("companies") if c["name"] == "id")
+    return isinstance(id_column["type"], String)
+
+
+def _uuid_bytes(value):
+    # Rows already holding bytes (or NULL) pass through unchanged
+    if value is None or isinstance(value, bytes):
+        return value
+    return UUID(value).bytes
+
+
+def convert_text_ids(path: str | Path) -> Path:
+    """
+    Rewrite a SQLite database with string ids into the current schema.
+
+    The current schema is created in a new file, every row is copied with
+    its id columns converted to 16-byte UUIDs, and the new file replaces
+    the original. The original is kept alongside as `<name>.bak`. Run it
+    with the app stopped. Returns the backup's path.
+    """
+    from src.storage.relational import RelationalStore
+
+    path = Path(path)
+    converted = path.with_name(path.name + ".converting")
+    backup = path.with_name(path.name + ".bak")
+    converted.unlink(missing_ok=True)
+
+    # Fold any WAL into the main file so it can be attached and moved
+    with sqlite3.connect(path) as legacy:
+        legacy.execute("PRAGMA journal_mode=DELETE")
+
+    async def _create_schema():
+        store = RelationalStore(f"sqlite+aiosqlite:///{converted}")
+        await store.initialize()
+        await store.close()
+
+    asyncio.run(_create_schema())
+
+    conn = sqlite3.connect(converted)
+    try:
+        conn.create_function("uuid_bytes", 1, _uuid_bytes, deterministic=True)
+        conn.execute("ATTACH DATABASE ? AS legacy", (str(path),))
+        for table in Base.metadata.sorted_tables:
+            legacy_columns = {
+                row[1] for row in conn.execute(f"PRAGMA legacy.table_info({table.name})")
+            }
+            columns = [c for c in table.columns if c.name in legacy_columns]
+            if not columns:
+                continue
+            names = ", ".join(c.name for c in columns)
+            values = ", ".join(
+                f"uuid_bytes({c.name})" if isinstance(c.type, UUIDType) else c.name
+                for c in columns
+            )
+            conn.execute(
+                f"INSERT INTO main.{table.name} ({names}) SELECT {values} FROM legacy.{table.name}"
+            )
+        conn.commit()
+        conn.execute("DETACH DATABASE legacy")
+        conn.execute("PRAGMA journal_mode=DELETE")
+    finally:
+        conn.close()
+
+    os.replace(path, backup)
+    os.replace(converted, path)
+    return backup
@@ -1,17 +1,53 @@
 """SQLAlchemy ORM models for the investor memory relational store."""
 
-import json
 from datetime import datetime
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 from sqlalchemy import (
-    Column, String, Text, DateTime, Float, ForeignKey, Table, Index
+    JSON, Column, String, Text, DateTime, Float, ForeignKey, Table, Index, LargeBinary
 )
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import DeclarativeBase, relationship
+from sqlalchemy.types import TypeDecorator
 
 
-def _new_uuid() -> str:
-    return str(uuid4())
+def _new_uuid() -> UUID:
+    return uuid4()
+
+
+class UUIDType(TypeDecorator):
+    """
+    UUID stored as 16 raw bytes (native UUID on PostgreSQL).
+
+    Accepts UUID objects or their string form on the way in; always
+    returns UUID objects.
+    """
+
+    impl = LargeBinary(16)
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(postgresql.UUID(as_uuid=True))
+        return dialect.type_descriptor(LargeBinary(16))
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        if not isinstance(value, UUID):
+            value = UUID(str(value))
+        return value if dialect.name == "postgresql" else value.bytes
+
+    def process_result_value(self, value, dialect):
+        if value is None or isinstance(value, UUID):
+            return value
+        return UUID(bytes=bytes(value))
+
+
+# Encoded by the engine's JSON serializer (see RelationalStore); plain JSON
+# text on SQLite, JSONB on PostgreSQL so metadata can be GIN-indexed
+JSONColumn = JSON().with_variant(JSONB(), "postgresql")
 
 
 class Base(DeclarativeBase):
@@ -23,23 +59,26 @@ class Base(DeclarativeBase):
 interaction_participants = Table(
     "interaction_participants",
     Base.metadata,
-    Column("interaction_id", String(36), ForeignKey("interactions.id"), primary_key=True),
-    Column("person_id", String(36), ForeignKey("people.id"), primary_key=True),
+    Column("interaction_id", UUIDType(), ForeignKey("interactions.id"), primary_key=True),
+    Column("person_id", UUIDType(), ForeignKey("people.id"), primary_key=True),
+    Index("ix_interaction_participants_person", "person_id", "interaction_id"),
 )
 
 chunk_entities = Table(
     "chunk_entities",
     Base.metadata,
-    Column("chunk_id", String(36), ForeignKey("chunks.id"), primary_key=True),
-    Column("entity_id", String(36), primary_key=True),
+    Column("chunk_id", UUIDType(), ForeignKey("chunks.id"), primary_key=True),
+    Column("entity_id", UUIDType(), primary_key=True),
     Column("entity_type", String(20)),  # company, person, theme
+    # The primary key leads with chunk_id; lookups by entity need their own
+    Index("ix_chunk_entities_entity_chunk", "entity_id", "chunk_id"),
 )
 
 artifact_companies = Table(
     "artifact_companies",
     Base.metadata,
-    Column("artifact_id", String(36), ForeignKey("artifacts.id"), primary_key=True),
-    Column("company_id", String(36), ForeignKey("companies.id"), primary_key=True),
+    Column("artifact_id", UUIDType(), ForeignKey("artifacts.id"), primary_key=True),
+    Column("company_id", UUIDType(), ForeignKey("companies.id"), primary_key=True),
 )
 
 
@@ -48,42 +87,57 @@ artifact_companies = Table(
 class CompanyRow(Base):
     __tablename__ = "companies"
 
-    id = Column(String(36), primary_key=True, default=_new_uuid)
+    id = Column(UUIDType(), primary_key=True, default=_new_uuid)
     name = Column(String(255), nullable=False, index=True)
     url = Column(String(512), unique=True, nullable=True)
     linkedin_url = Column(String(512), unique=True, nullable=True)
     description = Column(Text, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
 
+    __table_args__ = (
+        # Substring (ILIKE) name search on PostgreSQL; SQLite uses FTS5 instead
+        Index(
+            "ix_companies_name_trgm", "name",
+            postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
+
 
 class PersonRow(Base):
     __tablename__ = "people"
 
-    id = Column(String(36), primary_key=True, default=_new_uuid)
+    id = Column(UUIDType(), primary_key=True, default=_new_uuid)
     name = Column(String(255), nullable=False, index=True)
     linkedin_url = Column(String(512), unique=True, nullable=True)
     email = Column(String(255), unique=True, nullable=True)
-    company_id = Column(String(36), ForeignKey("companies.id"), nullable=True)
+    company_id = Column(UUIDType(), ForeignKey("companies.id"), nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
 
     company = relationship("CompanyRow", backref="people")
 
+    __table_args__ = (
+        Index(
+            "ix_people_name_trgm", "name",
+            postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
+
 
 class ThemeRow(Base):
     __tablename__ = "themes"
 
-    id = Column(String(36), primary_key=True, default=_new_uuid)
+    id = Column(UUIDType(), primary_key=True, default=_new_uuid)
     name = Column(String(255), nullable=False, unique=True, index=True)
-    keywords_json = Column(Text, default="[]")  # JSON list of keywords
+    keywords_json = Column(JSONColumn, default=list)  # List of keywords
     created_at = Column(DateTime, default=datetime.utcnow)
 
     @property
     def keywords(self) -> list[str]:
-        return json.loads(self.keywords_json) if self.keywords_json else []
+        return self.keywords_json or []
 
     @keywords.setter
     def keywords(self, value: list[str]):
-        self.keywords_json = json.dumps(value)
+        self.keywords_json = value
 
 
 # === Interaction / Artifact / Chunk tables ===
@@ -91,54 +145,61 @@ class ThemeRow(Base):
 class InteractionRow(Base):
     __tablename__ = "interactions"
 
-    id = Column(String(36), primary_key=True, default=_new_uuid)
+    id = Column(UUIDType(), primary_key=True, default=_new_uuid)
     source_type = Column(String(50), nullable=False)
     raw_text = Column(Text, nullable=False)
     timestamp = Column(DateTime, default=datetime.utcnow, index=True)
-    metadata_json = Column(Text, default="{}")
+    metadata_json = Column(JSONColumn, default=dict)
     created_at = Column(DateTime, default=datetime.utcnow)
 
     participants = relationship("PersonRow", secondary=interaction_participants, backref="interactions")
 
+    __table_args__ = (
+        Index(
+            "ix_interactions_metadata", "metadata_json",
+            postgresql_using="gin", postgresql_ops={"metadata_json": "jsonb_path_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
+
     @property
     def metadata_dict(self) -> dict:
-        return json.loads(self.metadata_json) if self.metadata_json else {}
+        return self.metadata_json or {}
 
     @metadata_dict.setter
     def metadata_dict(self, value: dict):
-        self.metadata_json = json.dumps(value)
+        self.metadata_json = value
 
 
 class ArtifactRow(Base):
     __tablename__ = "artifacts"
 
-    id = Column(String(36), primary_key=True, default=_new_uuid)
+    id = Column(UUIDType(), primary_key=True, default=_new_uuid)
     source_type = Column(String(50), nullable=False)
     raw_text = Column(Text, nullable=False)
     title = Column(String(512), nullable=True)
     timestamp = Column(DateTime, default=datetime.utcnow, index=True)
-    metadata_json = Column(Text, default="{}")
+    metadata_json = Column(JSONColumn, default=dict)
     created_at = Column(DateTime, default=datetime.utcnow)
 
     related_companies = relationship("CompanyRow", secondary=artifact_companies)
 
     @property
     def metadata_dict(self) -> dict:
-        return json.loads(self.metadata_json) if self.metadata_json else {}
+        return self.metadata_json or {}
 
     @metadata_dict.setter
     def metadata_dict(self, value: dict):
-        self.metadata_json = json.dumps(value)
+        self.metadata_json = value
 
 
 class ChunkRow(Base):
     __tablename__ = "chunks"
 
-    id = Column(String(36), primary_key=True, default=_new_uuid)
+    id = Column(UUIDType(), primary_key=True, default=_new_uuid)
     text = Column(Text, nullable=False)
-    source_id = Column(String(36), nullable=False, index=True)
+    source_id = Column(UUIDType(), nullable=False, index=True)
     source_type = Column(String(50), nullable=False)
-    metadata_json = Column(Text, default="{}")
+    metadata_json = Column(JSONColumn, default=dict)
     created_at = Column(DateTime, default=datetime.utcnow)
 
     __table_args__ = (
@@ -1,15 +1,28 @@
-import json
-from typing import Optional
+import asyncio
+from collections import defaultdict
+from contextlib import asynccontextmanager, nullcontext
+from contextvars import ContextVar
+from typing import AsyncIterator, Optional
 from uuid import UUID
 
-from sqlalchemy import select, delete as sa_delete
+import orjson
+from sqlalchemy import (
+    bindparam, column, event, insert, literal_column, or_, select, table, text, union,
+    delete as sa_delete,
+)
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from src.models import (
     Interaction, Artifact, Chunk,
-    Company, Person, Theme, SourceType, EntityType
+    Company, Person, Theme, Entity, SourceType, EntityType
 )
 from src.storage.base import StorageBackend
+from src.storage.legacy import LegacySchemaError, has_text_ids
 from src.storage.models import (
     Base, CompanyRow, PersonRow, ThemeRow,
     InteractionRow, ArtifactRow, ChunkRow,
@@ -17,35 +30,281 @@ from src.storage.models import (
 )
 
 
+# Applied to every new SQLite connection. WAL lets /search reads proceed
+# while ingestion writes; synchronous=NORMAL drops the per-commit fsync.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA busy_timeout=5000",
+)
+
+
+# journal_mode is persisted in the database file by the writer and can't
+# be set from a read-only connection
+SQLITE_READONLY_PRAGMAS = tuple(p for p in SQLITE_PRAGMAS if "journal_mode" not in p)
+
+
+def _json_dumps(value) -> str:
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
+def _apply_sqlite_readonly_pragmas(dbapi_connection, connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_READONLY_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
+# Exact-match lookups the linker issues for every extracted entity. Built
+# once with bind parameters so each call is a params dict plus a compiled
+# cache hit rather than a fresh select() construction.
+_COMPANY_BY_URL = select(CompanyRow).where(CompanyRow.url == bindparam("value"))
+_COMPANY_BY_LINKEDIN = select(CompanyRow).where(CompanyRow.linkedin_url == bindparam("value"))
+_PERSON_BY_EMAIL = select(PersonRow).where(PersonRow.email == bindparam("value"))
+_PERSON_BY_LINKEDIN = select(PersonRow).where(PersonRow.linkedin_url == bindparam("value"))
+
+
 class RelationalStore(StorageBackend):
     """
     Relational database storage using async SQLAlchemy.
 
     Uses sqlite+aiosqlite:/// for dev, postgresql+asyncpg:/// for production.
+
+    For file-backed SQLite, reads go through a separate read-only engine so
+    they never queue behind ingestion writes for a pooled connection; with
+    WAL, readers and the writer don't block each other.
+
+    Calls made inside `async with store.transaction():` share one session
+    and commit once on exit.
     """
 
-    def __init__(self, connection_string: str = "sqlite+aiosqlite:///investor_memory.db"):
+    def __init__(
+        self,
+        connection_string: str = "sqlite+aiosqlite:///investor_memory.db",
+        pool_size: int = 5,
+        max_overflow: int = 10,
+    ):
         self.connection_string = connection_string
-        self.engine = create_async_engine(connection_string, echo=False)
+        self.engine = create_async_engine(
+            connection_string,
+            echo=False,
+            json_serializer=_json_dumps,
+            json_deserializer=orjson.loads,
+            **self._engine_options(connection_string, pool_size, max_overflow),
+        )
+        if self.engine.dialect.name == "sqlite":
+            event.listen(self.engine.sync_engine, "connect", _apply_sqlite_pragmas)
         self.session_factory = async_sessionmaker(self.engine, expire_on_commit=False)
 
+        readonly_url = self._readonly_url(connection_string)
+        if readonly_url:
+            self.read_engine = create_async_engine(
+                readonly_url,
+                echo=False,
+                json_serializer=_json_dumps,
+                json_deserializer=orjson.loads,
+                poolclass=AsyncAdaptedQueuePool,
+                pool_size=8,
+                max_overflow=8,
+            )
+            event.listen(self.read_engine.sync_engine, "connect", _apply_sqlite_readonly_pragmas)
+            self.read_session_factory = async_sessionmaker(self.read_engine, expire_on_commit=False)
+        else:
+            self.read_engine = self.engine
+            self.read_session_factory = self.session_factory
+        # An in-memory database is a single shared connection, so concurrent
+        # sessions would interleave inside one transaction. Serialize them.
+        self._session_lock = asyncio.Lock() if ":memory:" in connection_string else nullcontext()
+        # Whether SQLite name searches can use the trigram FTS tables (set by initialize)
+        self._name_fts = False
+        # Session of the enclosing transaction() block, if any
+        self._transaction: ContextVar[Optional[AsyncSession]] = ContextVar(
+            f"relational_store_transaction_{id(self)}", default=None
+        )
+
+    @staticmethod
+    def _engine_options(connection_string: str, pool_size: int = 5, max_overflow: int = 10) -> dict:
+        # In-memory SQLite must keep SQLAlchemy's default single shared
+        # connection; a pool would hand out separate empty databases.
+        if ":memory:" in connection_string:
+            return {}
+        options = {
+            "poolclass": AsyncAdaptedQueuePool,
+            "pool_size": pool_size,
+            "max_overflow": max_overflow,
+        }
+        # A local SQLite file can't drop a connection, so the per-checkout
+        # ping is only paid for network databases, which also recycle
+        # connections before server-side idle timeouts
+        url = make_url(connection_string)
+        if url.get_backend_name() != "sqlite":
+            options.update(pool_pre_ping=True, pool_recycle=3600)
+        # asyncpg keeps server-side prepared statements per connection;
+        # room for every hot query avoids re-parsing and re-planning
+        if url.get_driver_name() == "asyncpg":
+            options["connect_args"] = {"prepared_statement_cache_size": 256}
+        return options
+
+    @staticmethod
+    def _readonly_url(connection_string: str) -> Optional[str]:
+        """Read-only URI for a file-backed SQLite database, else None."""
+        url = make_url(connection_string)
+        if url.get_backend_name() != "sqlite" or not url.database or ":memory:" in connection_string:
+            return None
+        return url.set(
+            database=f"file:{url.database}",
+            query={**url.query, "mode": "ro", "uri": "true"},
+        ).render_as_string(hide_password=False)
+
     async def initialize(self):
         """Create all tables."""
         async with self.engine.begin() as conn:
+            if await conn.run_sync(has_text_ids):
+                raise LegacySchemaError(
+                    f"{self.engine.url.database} stores ids as text, from before ids "
+                    "became 16-byte UUIDs. Convert it with "
+                    "`python scripts/convert_text_ids.py <path>` (SQLite), "
+                    "or delete it and re-seed."
+                )
+            if self.engine.dialect.name == "postgresql":
+                # Backs the gin_trgm_ops name indexes used by ILIKE searches
+                await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
             await conn.run_sync(Base.metadata.create_all)
+            if self.engine.dialect.name == "sqlite":
+                self._name_fts = await self._create_name_fts(conn)
+
+    @staticmethod
+    async def _create_name_fts(conn) -> bool:
+        """
+        Create trigram FTS5 indexes over company and person names.
+
+        They turn `name LIKE '%...%'` substring searches into index lookups.
+        Returns False when this SQLite build lacks FTS5's trigram tokenizer.
+        """
+        for table_name in (CompanyRow.__tablename__, PersonRow.__tablename__):
+            fts = f"{table_name}_name_fts"
+            exists = (await conn.execute(
+                text("SELECT 1 FROM sqlite_master WHERE name = :name"), {"name": fts}
+            )).first()
+            if exists:
+                continue
+            try:
+                await conn.execute(text(
+                    f"CREATE VIRTUAL TABLE {fts} USING fts5("
+                    f"name, content='{table_name}', content_rowid='rowid', tokenize='trigram')"
+                ))
+            except OperationalError:
+                return False
+            await conn.execute(text(
+                f"CREATE TRIGGER {fts}_ai AFTER INSERT ON {table_name} BEGIN "
+                f"INSERT INTO {fts}(rowid, name) VALUES (new.rowid, new.name); END"
+            ))
+            await conn.execute(text(
+                f"CREATE TRIGGER {fts}_ad AFTER DELETE ON {table_name} BEGIN "
+                f"INSERT INTO {fts}({fts}, rowid, name) VALUES ('delete', old.rowid, old.name); END"
+            ))
+            await conn.execute(text(
+                f"CREATE TRIGGER {fts}_au AFTER UPDATE OF name ON {table_name} BEGIN "
+                f"INSERT INTO {fts}({fts}, rowid, name) VALUES ('delete', old.rowid, old.name); "
+                f"INSERT INTO {fts}(rowid, name) VALUES (new.rowid, new.name); END"
+            ))
+            # Index rows that predate the FTS table
+            await conn.execute(text(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')"))
+        return True
+
+    def _name_contains(self, row_cls, names: list[str]):
+        """Clause matching rows whose name contains any of `names`, ignoring case."""
+        if not self._name_fts:
+            return or_(*(row_cls.name.ilike(f"%{n}%") for n in names))
+        fts = table(f"{row_cls.__tablename__}_name_fts", column("rowid"), column("name"))
+        matches = [select(fts.c.rowid).where(fts.c.name.like(f"%{n}%")) for n in names]
+        return self._rowid(row_cls).in_(matches[0] if len(matches) == 1 else union(*matches))
+
+    @staticmethod
+    def _rowid(row_cls):
+        return literal_column(f"{row_cls.__tablename__}.rowid")
+
+    def _scan_order(self, row_cls) -> tuple:
+        # Keep the table-scan (insertion) order the plain ILIKE query returned
+        return (self._rowid(row_cls),) if self._name_fts else ()
 
     async def close(self):
+        if self.read_engine is not self.engine:
+            await self.read_engine.dispose()
         await self.engine.dispose()
 
-    def _session(self) -> AsyncSession:
-        return self.session_factory()
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        """
+        Run the store calls made inside the block in a single transaction.
+
+        Writes are committed once on exit (rolled back on error) instead of
+        once per call, and reads see the block's uncommitted writes. The
+        calls share one session, so don't run them concurrently with each
+        other. Nested blocks join the outer transaction.
+        """
+        if self._transaction.get() is not None:
+            yield
+            return
+        async with self._session_lock:
+            async with self.session_factory() as session:
+                token = self._transaction.set(session)
+                try:
+                    yield
+                    await session.commit()
+                except BaseException:
+                    await session.rollback()
+                    raise
+                finally:
+                    self._transaction.reset(token)
+
+    def in_transaction(self) -> bool:
+        """Whether the calling task is inside a transaction() block."""
+        return self._transaction.get() is not None
+
+    @asynccontextmanager
+    async def _session(self) -> AsyncIterator[AsyncSession]:
+        active = self._transaction.get()
+        if active is not None:
+            yield active
+            return
+        async with self._session_lock:
+            async with self.session_factory() as session:
+                yield session
+
+    @asynccontextmanager
+    async def _read_session(self) -> AsyncIterator[AsyncSession]:
+        active = self._transaction.get()
+        if active is not None:
+            yield active
+            return
+        async with self._session_lock:
+            async with self.read_session_factory() as session:
+                yield session
+
+    async def _commit(self, session: AsyncSession) -> None:
+        # Inside transaction() the block commits; just send the writes
+        if self._transaction.get() is session:
+            await session.flush()
+        else:
+            await session.commit()
 
     # === Conversions: domain model <-> ORM row ===
 
     @staticmethod
     def _company_from_row(row: CompanyRow) -> Company:
         return Company(
-            id=UUID(row.id),
+            id=row.id,
             name=row.name,
             url=row.url,
             linkedin_url=row.linkedin_url,
@@ -56,91 +315,103 @@ class RelationalStore(StorageBackend):
     @staticmethod
     def _person_from_row(row: PersonRow) -> Person:
         return Person(
-            id=UUID(row.id),
+            id=row.id,
             name=row.name,
             linkedin_url=row.linkedin_url,
             email=row.email,
-            company_id=UUID(row.company_id) if row.company_id else None,
+            company_id=row.company_id,
             created_at=row.created_at,
         )
 
     @staticmethod
     def _theme_from_row(row: ThemeRow) -> Theme:
         return Theme(
-            id=UUID(row.id),
+            id=row.id,
             name=row.name,
             keywords=row.keywords,
             created_at=row.created_at,
         )
 
     @staticmethod
-    def _interaction_from_row(row: InteractionRow, participant_ids: list[str] | None = None) -> Interaction:
+    def _interaction_from_row(row: InteractionRow, participant_ids: list[UUID] | None = None) -> Interaction:
         return Interaction(
-            id=UUID(row.id),
+            id=row.id,
             source_type=SourceType(row.source_type),
             raw_text=row.raw_text,
             timestamp=row.timestamp,
-            participants=[UUID(pid) for pid in (participant_ids or [])],
-            metadata=json.loads(row.metadata_json) if row.metadata_json else {},
+            participants=list(participant_ids or []),
+            metadata=row.metadata_json or {},
             created_at=row.created_at,
         )
 
     @staticmethod
     def _artifact_from_row(row: ArtifactRow) -> Artifact:
         return Artifact(
-            id=UUID(row.id),
+            id=row.id,
             source_type=SourceType(row.source_type),
             raw_text=row.raw_text,
             title=row.title,
             timestamp=row.timestamp,
-            metadata=json.loads(row.metadata_json) if row.metadata_json else {},
+            metadata=row.metadata_json or {},
             created_at=row.created_at,
         )
 
     @staticmethod
-    def _chunk_from_row(row: ChunkRow, entity_ids: list[str] | None = None) -> Chunk:
+    def _chunk_from_row(row: ChunkRow, entity_refs: list[tuple[UUID, str]] | None = None) -> Chunk:
+        entity_ids = [eid for eid, _ in (entity_refs or [])]
         return Chunk(
-            id=UUID(row.id),
+            id=row.id,
             text=row.text,
-            source_id=UUID(row.source_id),
+            source_id=row.source_id,
             source_type=SourceType(row.source_type),
-            entity_ids=[UUID(eid) for eid in (entity_ids or [])],
-            metadata=json.loads(row.metadata_json) if row.metadata_json else {},
+            entity_ids=entity_ids,
+            # Rows written before types were recorded have an empty entity_type
+            entity_types={
+                eid: EntityType(etype)
+                for eid, (_, etype) in zip(entity_ids, entity_refs or [])
+                if etype
+            },
+            metadata=row.metadata_json or {},
             created_at=row.created_at,
         )
 
     # === Interactions ===
 
     async def save_interaction(self, interaction: Interaction) -> None:
-        async with self._session() as session:
-            row = InteractionRow(
-                id=str(interaction.id),
-                source_type=interaction.source_type.value,
-                raw_text=interaction.raw_text,
-                timestamp=interaction.timestamp,
-                metadata_json=json.dumps(interaction.metadata),
-                created_at=interaction.created_at,
-            )
-            session.add(row)
-            # Add participant associations
-            for pid in interaction.participants:
-                await session.execute(
-                    interaction_participants.insert().values(
-                        interaction_id=str(interaction.id),
-                        person_id=str(pid),
-                    )
-                )
-            await session.commit()
+        await self.save_interactions([interaction])
+
+    async def save_interactions(self, interactions: list[Interaction], batch_size: int = 500) -> None:
+        interaction_rows = [
+            {
+                "id": interaction.id,
+                "source_type": interaction.source_type.value,
+                "raw_text": interaction.raw_text,
+                "timestamp": interaction.timestamp,
+                "metadata_json": interaction.metadata,
+                "created_at": interaction.created_at,
+            }
+            for interaction in interactions
+        ]
+        participant_rows = [
+            {"interaction_id": interaction.id, "person_id": pid}
+            for interaction in interactions
+            for pid in interaction.participants
+        ]
+        await self._upsert_many(
+            (InteractionRow.__table__, ["id"], interaction_rows),
+            (interaction_participants, ["interaction_id", "person_id"], participant_rows),
+            batch_size=batch_size,
+        )
 
     async def get_interaction(self, id: UUID) -> Optional[Interaction]:
-        async with self._session() as session:
-            row = await session.get(InteractionRow, str(id))
+        async with self._read_session() as session:
+            row = await session.get(InteractionRow, id)
             if not row:
                 return None
             # Get participants
             result = await session.execute(
                 select(interaction_participants.c.person_id).where(
-                    interaction_participants.c.interaction_id == str(id)
+                    interaction_participants.c.interaction_id == id
                 )
             )
             pids = [r[0] for r in result.fetchall()]
@@ -149,46 +420,56 @@ class RelationalStore(StorageBackend):
     async def get_interactions_by_participant(
         self, person_id: UUID, limit: int = 50
     ) -> list[Interaction]:
-        async with self._session() as session:
+        async with self._read_session() as session:
             result = await session.execute(
-                select(interaction_participants.c.interaction_id).where(
-                    interaction_participants.c.person_id == str(person_id)
+                select(InteractionRow)
+                .join(
+                    interaction_participants,
+                    interaction_participants.c.interaction_id == InteractionRow.id,
                 )
+                .where(interaction_participants.c.person_id == person_id)
+                .limit(limit)
+            )
+            rows = result.scalars().all()
+            if not rows:
+                return []
+            # Everyone who took part, for all matched interactions in one query
+            result = await session.execute(
+                select(
+                    interaction_participants.c.interaction_id,
+                    interaction_participants.c.person_id,
+                ).where(interaction_participants.c.interaction_id.in_([row.id for row in rows]))
             )
-            iids = [r[0] for r in result.fetchall()]
-            interactions = []
-            for iid in iids[:limit]:
-                row = await session.get(InteractionRow, iid)
-                if row:
-                    interactions.append(self._interaction_from_row(row))
-            return interactions
+            participants: dict[UUID, list[UUID]] = defaultdict(list)
+            for iid, pid in result:
+                participants[iid].append(pid)
+            return [self._interaction_from_row(row, participants[row.id]) for row in rows]
 
     # === Artifacts ===
 
     async def save_artifact(self, artifact: Artifact) -> None:
         async with self._session() as session:
             row = ArtifactRow(
-                id=str(artifact.id),
+                id=artifact.id,
                 source_type=artifact.source_type.value,
                 raw_text=artifact.raw_text,
                 title=artifact.title,
                 timestamp=artifact.timestamp,
-                metadata_json=json.dumps(artifact.metadata),
+                metadata_json=artifact.metadata,
                 created_at=artifact.created_at,
             )
             session.add(row)
-            for cid in artifact.related_companies:
+            if artifact.related_companies:
+                # One executemany for every link; executing it flushes the row first
                 await session.execute(
-                    artifact_companies.insert().values(
-                        artifact_id=str(artifact.id),
-                        company_id=str(cid),
-                    )
+                    artifact_companies.insert(),
+                    [{"artifact_id": artifact.id, "company_id": cid} for cid in artifact.related_companies],
                 )
-            await session.commit()
+            await self._commit(session)
 
     async def get_artifact(self, id: UUID) -> Optional[Artifact]:
-        async with self._session() as session:
-            row = await session.get(ArtifactRow, str(id))
+        async with self._read_session() as session:
+            row = await session.get(ArtifactRow, id)
             if not row:
                 return None
             return self._artifact_from_row(row)
@@ -196,113 +477,238 @@ class RelationalStore(StorageBackend):
     # === Chunks ===
 
     async def save_chunk(self, chunk: Chunk) -> None:
-        async with self._session() as session:
-            row = ChunkRow(
-                id=str(chunk.id),
-                text=chunk.text,
-                source_id=str(chunk.source_id),
-                source_type=chunk.source_type.value,
-                metadata_json=json.dumps(chunk.metadata),
-                created_at=chunk.created_at,
-            )
-            session.add(row)
-            # Save chunk-entity associations
-            for eid in chunk.entity_ids:
-                await session.execute(
-                    chunk_entities.insert().values(
-                        chunk_id=str(chunk.id),
-                        entity_id=str(eid),
-                        entity_type="",  # We don't always know the type here
-                    )
-                )
-            await session.commit()
+        await self.save_chunks([chunk])
+
+    async def save_chunks(self, chunks: list[Chunk], batch_size: int = 500) -> None:
+        chunk_rows = [
+            {
+                "id": chunk.id,
+                "text": chunk.text,
+                "source_id": chunk.source_id,
+                "source_type": chunk.source_type.value,
+                "metadata_json": chunk.metadata,
+                "created_at": chunk.created_at,
+            }
+            for chunk in chunks
+        ]
+        link_rows = [
+            {
+                "chunk_id": chunk.id,
+                "entity_id": eid,
+                "entity_type": chunk.entity_types[eid].value if eid in chunk.entity_types else "",
+            }
+            for chunk in chunks
+            for eid in chunk.entity_ids
+        ]
+        await self._upsert_many(
+            (ChunkRow.__table__, ["id"], chunk_rows),
+            (chunk_entities, ["chunk_id", "entity_id"], link_rows),
+            batch_size=batch_size,
+        )
 
     async def get_chunks_by_source(self, source_id: UUID) -> list[Chunk]:
-        async with self._session() as session:
+        async with self._read_session() as session:
             result = await session.execute(
-                select(ChunkRow).where(ChunkRow.source_id == str(source_id))
+                select(ChunkRow).where(ChunkRow.source_id == source_id)
             )
-            rows = result.scalars().all()
-            chunks = []
-            for row in rows:
-                eids = await self._get_chunk_entity_ids(session, row.id)
-                chunks.append(self._chunk_from_row(row, eids))
-            return chunks
-
-    async def get_chunks_by_entity(self, entity_id: UUID, limit: int = 50) -> list[Chunk]:
-        async with self._session() as session:
+            return await self._chunks_from_rows(session, result.scalars().all())
+
+    async def get_chunks_by_entity(
+        self, entity_id: UUID, limit: int = 50, offset: int = 0
+    ) -> list[Chunk]:
+        async with self._read_session() as session:
+            # Served from ix_chunk_entities_entity_chunk: the filter and the
+            # paging order both come from the index
             result = await session.execute(
-                select(chunk_entities.c.chunk_id).where(
-                    chunk_entities.c.entity_id == str(entity_id)
-                )
+                select(ChunkRow)
+                .join(chunk_entities, chunk_entities.c.chunk_id == ChunkRow.id)
+                .where(chunk_entities.c.entity_id == entity_id)
+                .order_by(chunk_entities.c.chunk_id)
+                .offset(offset)
+                .limit(limit)
             )
-            cids = [r[0] for r in result.fetchall()]
-            chunks = []
-            for cid in cids[:limit]:
-                row = await session.get(ChunkRow, cid)
-                if row:
-                    eids = await self._get_chunk_entity_ids(session, row.id)
-                    chunks.append(self._chunk_from_row(row, eids))
-            return chunks
-
-    async def _get_chunk_entity_ids(self, session: AsyncSession, chunk_id: str) -> list[str]:
+            return await self._chunks_from_rows(session, result.scalars().all())
+
+    async def _chunks_from_rows(self, session: AsyncSession, rows) -> list[Chunk]:
+        """Build chunks, fetching the entity links of all rows in one query."""
+        if not rows:
+            return []
         result = await session.execute(
-            select(chunk_entities.c.entity_id).where(
-                chunk_entities.c.chunk_id == chunk_id
-            )
+            select(
+                chunk_entities.c.chunk_id,
+                chunk_entities.c.entity_id,
+                chunk_entities.c.entity_type,
+            ).where(chunk_entities.c.chunk_id.in_([row.id for row in rows]))
         )
-        return [r[0] for r in result.fetchall()]
+        refs: dict[UUID, list[tuple[UUID, str]]] = defaultdict(list)
+        for chunk_id, eid, etype in result:
+            refs[chunk_id].append((eid, etype or ""))
+        return [self._chunk_from_row(row, refs.get(row.id)) for row in rows]
+
+    # === Bulk writes ===
+
+    def _upsert(self, table, key_columns: list[str]):
+        """INSERT ... ON CONFLICT DO UPDATE for the engine's dialect."""
+        dialect = self.engine.dialect.name
+        if dialect == "sqlite":
+            stmt = sqlite_insert(table)
+        elif dialect == "postgresql":
+            stmt = postgresql_insert(table)
+        else:
+            return insert(table)
+        updates = {c.name: stmt.excluded[c.name] for c in table.c if c.name not in key_columns}
+        if not updates:
+            return stmt.on_conflict_do_nothing(index_elements=key_columns)
+        return stmt.on_conflict_do_update(index_elements=key_columns, set_=updates)
+
+    async def _upsert_many(self, *writes: tuple, batch_size: int = 500) -> None:
+        """
+        Upsert (table, key_columns, rows) groups in one transaction.
+
+        Each batch of `batch_size` rows is a single executemany.
+        """
+        if not any(rows for _, _, rows in writes):
+            return
+        async with self._session() as session:
+            for table, key_columns, rows in writes:
+                stmt = self._upsert(table, key_columns)
+                for start in range(0, len(rows), batch_size):
+                    await session.execute(stmt, rows[start:start + batch_size])
+            await self._commit(session)
+
+    # === Bulk lookups ===
+
+    async def _rows_where_in(self, row_cls, column, values: list[str]) -> list:
+        if not values:
+            return []
+        async with self._read_session() as session:
+            result = await session.execute(select(row_cls).where(column.in_(values)))
+            return list(result.scalars().all())
+
+    async def _first_rows_matching_names(self, row_cls, names: list[str]) -> dict:
+        """
+        Map each name to the first row whose name contains it, case-insensitively.
+
+        Equivalent to one `name ILIKE '%name%' LIMIT 1` query per name, but
+        issues a single OR'd query for all of them.
+        """
+        names = list(dict.fromkeys(names))
+        if not names:
+            return {}
+        async with self._read_session() as session:
+            result = await session.execute(
+                select(row_cls).where(self._name_contains(row_cls, names)).order_by(*self._scan_order(row_cls))
+            )
+            rows = result.scalars().all()
+
+        matches = {}
+        for name in names:
+            needle = name.lower()
+            row = next((r for r in rows if needle in r.name.lower()), None)
+            if row is not None:
+                matches[name] = row
+        return matches
+
+    async def get_entities_bulk(
+        self,
+        ids: list[UUID],
+        entity_types: Optional[dict[UUID, EntityType]] = None,
+    ) -> dict[UUID, Entity]:
+        if not ids:
+            return {}
+        entity_types = entity_types or {}
+        # Typed ids only hit their own table; untyped ones are probed in all three
+        untyped = {i for i in ids if i not in entity_types}
+        keys_by_type = {etype: set(untyped) for etype in EntityType}
+        for i in ids:
+            if i in entity_types:
+                keys_by_type[entity_types[i]].add(i)
+
+        entities: dict[UUID, Entity] = {}
+        async with self._read_session() as session:
+            for etype, row_cls, from_row in (
+                (EntityType.COMPANY, CompanyRow, self._company_from_row),
+                (EntityType.PERSON, PersonRow, self._person_from_row),
+                (EntityType.THEME, ThemeRow, self._theme_from_row),
+            ):
+                keys = keys_by_type[etype]
+                if not keys:
+                    continue
+                result = await session.execute(select(row_cls).where(row_cls.id.in_(keys)))
+                for row in result.scalars():
+                    entity = from_row(row)
+                    entities[entity.id] = entity
+        return entities
 
     # === Companies ===
 
+    @staticmethod
+    def _company_to_row(company: Company) -> CompanyRow:
+        return CompanyRow(
+            id=company.id,
+            name=company.name,
+            url=company.url,
+            linkedin_url=company.linkedin_url,
+            description=company.description,
+            created_at=company.created_at,
+        )
+
     async def save_company(self, company: Company) -> None:
         async with self._session() as session:
-            row = CompanyRow(
-                id=str(company.id),
-                name=company.name,
-                url=company.url,
-                linkedin_url=company.linkedin_url,
-                description=company.description,
-                created_at=company.created_at,
-            )
-            session.add(row)
-            await session.commit()
+            session.add(self._company_to_row(company))
+            await self._commit(session)
 
-    async def get_company(self, id: UUID) -> Optional[Company]:
+    async def save_companies(self, companies: list[Company]) -> None:
+        if not companies:
+            return
         async with self._session() as session:
-            row = await session.get(CompanyRow, str(id))
+            session.add_all([self._company_to_row(c) for c in companies])
+            await self._commit(session)
+
+    async def get_company(self, id: UUID) -> Optional[Company]:
+        async with self._read_session() as session:
+            row = await session.get(CompanyRow, id)
             return self._company_from_row(row) if row else None
 
     async def get_company_by_url(self, url: str) -> Optional[Company]:
-        async with self._session() as session:
-            result = await session.execute(
-                select(CompanyRow).where(CompanyRow.url == url)
-            )
+        async with self._read_session() as session:
+            result = await session.execute(_COMPANY_BY_URL, {"value": url})
             row = result.scalar_one_or_none()
             return self._company_from_row(row) if row else None
 
     async def get_company_by_linkedin(self, linkedin_url: str) -> Optional[Company]:
-        async with self._session() as session:
-            result = await session.execute(
-                select(CompanyRow).where(CompanyRow.linkedin_url == linkedin_url)
-            )
+        async with self._read_session() as session:
+            result = await session.execute(_COMPANY_BY_LINKEDIN, {"value": linkedin_url})
             row = result.scalar_one_or_none()
             return self._company_from_row(row) if row else None
 
     async def search_companies_by_name(
         self, name: str, limit: int = 5
     ) -> list[Company]:
-        async with self._session() as session:
+        async with self._read_session() as session:
             result = await session.execute(
                 select(CompanyRow)
-                .where(CompanyRow.name.ilike(f"%{name}%"))
+                .where(self._name_contains(CompanyRow, [name]))
+                .order_by(*self._scan_order(CompanyRow))
                 .limit(limit)
             )
             return [self._company_from_row(r) for r in result.scalars().all()]
 
+    async def get_companies_by_linkedin_urls(self, linkedin_urls: list[str]) -> list[Company]:
+        rows = await self._rows_where_in(CompanyRow, CompanyRow.linkedin_url, linkedin_urls)
+        return [self._company_from_row(r) for r in rows]
+
+    async def get_companies_by_urls(self, urls: list[str]) -> list[Company]:
+        rows = await self._rows_where_in(CompanyRow, CompanyRow.url, urls)
+        return [self._company_from_row(r) for r in rows]
+
+    async def search_companies_by_names(self, names: list[str]) -> dict[str, Company]:
+        matches = await self._first_rows_matching_names(CompanyRow, names)
+        return {name: self._company_from_row(r) for name, r in matches.items()}
+
     async def list_companies(self, limit: int = 50) -> list[Company]:
         """List all companies, ordered by name."""
-        async with self._session() as session:
+        async with self._read_session() as session:
             result = await session.execute(
                 select(CompanyRow).order_by(CompanyRow.name).limit(limit)
             )
@@ -310,79 +716,116 @@ class RelationalStore(StorageBackend):
 
     # === People ===
 
+    @staticmethod
+    def _person_to_row(person: Person) -> PersonRow:
+        return PersonRow(
+            id=person.id,
+            name=person.name,
+            linkedin_url=person.linkedin_url,
+            email=person.email,
+            company_id=person.company_id,
+            created_at=person.created_at,
+        )
+
     async def save_person(self, person: Person) -> None:
         async with self._session() as session:
-            row = PersonRow(
-                id=str(person.id),
-                name=person.name,
-                linkedin_url=person.linkedin_url,
-                email=person.email,
-                company_id=str(person.company_id) if person.company_id else None,
-                created_at=person.created_at,
-            )
-            session.add(row)
-            await session.commit()
+            session.add(self._person_to_row(person))
+            await self._commit(session)
 
-    async def get_person(self, id: UUID) -> Optional[Person]:
+    async def save_people(self, people: list[Person]) -> None:
+        if not people:
+            return
         async with self._session() as session:
-            row = await session.get(PersonRow, str(id))
+            session.add_all([self._person_to_row(p) for p in people])
+            await self._commit(session)
+
+    async def get_person(self, id: UUID) -> Optional[Person]:
+        async with self._read_session() as session:
+            row = await session.get(PersonRow, id)
             return self._person_from_row(row) if row else None
 
     async def get_person_by_email(self, email: str) -> Optional[Person]:
-        async with self._session() as session:
-            result = await session.execute(
-                select(PersonRow).where(PersonRow.email == email)
-            )
+        async with self._read_session() as session:
+            result = await session.execute(_PERSON_BY_EMAIL, {"value": email})
             row = result.scalar_one_or_none()
             return self._person_from_row(row) if row else None
 
     async def get_person_by_linkedin(self, linkedin_url: str) -> Optional[Person]:
-        async with self._session() as session:
-            result = await session.execute(
-                select(PersonRow).where(PersonRow.linkedin_url == linkedin_url)
-            )
+        async with self._read_session() as session:
+            result = await session.execute(_PERSON_BY_LINKEDIN, {"value": linkedin_url})
             row = result.scalar_one_or_none()
             return self._person_from_row(row) if row else None
 
     async def search_people_by_name(
         self, name: str, limit: int = 5
     ) -> list[Person]:
-        async with self._session() as session:
+        async with self._read_session() as session:
             result = await session.execute(
                 select(PersonRow)
-                .where(PersonRow.name.ilike(f"%{name}%"))
+                .where(self._name_contains(PersonRow, [name]))
+                .order_by(*self._scan_order(PersonRow))
                 .limit(limit)
             )
             return [self._person_from_row(r) for r in result.scalars().all()]
 
+    async def get_people_by_linkedin_urls(self, linkedin_urls: list[str]) -> list[Person]:
+        rows = await self._rows_where_in(PersonRow, PersonRow.linkedin_url, linkedin_urls)
+        return [self._person_from_row(r) for r in rows]
+
+    async def get_people_by_emails(self, emails: list[str]) -> list[Person]:
+        rows = await self._rows_where_in(PersonRow, PersonRow.email, emails)
+        return [self._person_from_row(r) for r in rows]
+
+    async def search_people_by_names(self, names: list[str]) -> dict[str, Person]:
+        matches = await self._first_rows_matching_names(PersonRow, names)
+        return {name: self._person_from_row(r) for name, r in matches.items()}
+
     async def list_people(self, limit: int = 50) -> list[Person]:
         """List all people, ordered by name."""
-        async with self._session() as session:
+        async with self._read_session() as session:
             result = await session.execute(
                 select(PersonRow).order_by(PersonRow.name).limit(limit)
             )
             return [self._person_from_row(r) for r in result.scalars().all()]
 
+    async def list_people_with_company(
+        self, q: str = "", limit: int = 50
+    ) -> list[tuple[Person, Optional[Company]]]:
+        """List/search people joined with their associated company in one query."""
+        async with self._read_session() as session:
+            stmt = select(PersonRow, CompanyRow).outerjoin(
+                CompanyRow, PersonRow.company_id == CompanyRow.id
+            )
+            if q:
+                stmt = stmt.where(self._name_contains(PersonRow, [q])).order_by(*self._scan_order(PersonRow))
+            else:
+                stmt = stmt.order_by(PersonRow.name)
+            result = await session.execute(stmt.limit(limit))
+            return [
+                (self._person_from_row(p), self._company_from_row(c) if c else None)
+                for p, c in result.all()
+            ]
+
     # === Themes ===
 
     async def save_theme(self, theme: Theme) -> None:
         async with self._session() as session:
             row = ThemeRow(
-                id=str(theme.id),
+                id=theme.id,
                 name=theme.name,
                 created_at=theme.created_at,
             )
             row.keywords = theme.keywords
             session.add(row)
-            await session.commit()
+            await self._commit(session)
 
     async def get_theme(self, id: UUID) -> Optional[Theme]:
-        async with self._session() as session:
-            row = await session.get(ThemeRow, str(id))
+        async with self._read_session() as session:
+            row = await session.get(ThemeRow, id)
             return self._theme_from_row(row) if row else None
 
     async def get_theme_by_name(self, name: str) -> Optional[Theme]:
-        async with self._session() as session:
+        async with self._read_session() as session:
             result = await session.execute(
                 select(ThemeRow).where(ThemeRow.name == name)
             )
@@ -1,10 +1,12 @@
+import asyncio
 from dataclasses import dataclass
 from typing import Optional
 from uuid import UUID
 
 import chromadb
+import numpy as np
 
-from src.models import Chunk, SourceType
+from src.models import Chunk, EntityType, SourceType
 
 
 @dataclass
@@ -21,6 +23,10 @@ class VectorStoreConfig:
     embedding_dimension: int = 384  # all-MiniLM-L6-v2
     metric: str = "cosine"
     persist_directory: str = "./chroma_data"
+    # HNSW graph parameters (applied when the collection is created)
+    hnsw_m: int = 32  # Neighbors per node; higher = better recall, more memory
+    hnsw_construction_ef: int = 128
+    hnsw_search_ef: int = 64  # Candidate list size at query time
 
 
 class VectorStore:
@@ -28,102 +34,141 @@ class VectorStore:
     Vector store for semantic search over chunks using ChromaDB.
     """
 
-    def __init__(self, config: VectorStoreConfig | None = None):
+    def __init__(self, config: VectorStoreConfig | None = None, client=None):
         self.config = config or VectorStoreConfig()
-        self.client = chromadb.PersistentClient(path=self.config.persist_directory)
+        # An existing Chroma client may be shared across stores (one per collection)
+        self.client = client or chromadb.PersistentClient(path=self.config.persist_directory)
         self.collection = self.client.get_or_create_collection(
             name=self.config.collection_name,
-            metadata={"hnsw:space": self.config.metric},
+            metadata=self._collection_metadata(),
         )
 
+    def _collection_metadata(self) -> dict:
+        return {
+            "hnsw:space": self.config.metric,
+            "hnsw:M": self.config.hnsw_m,
+            "hnsw:construction_ef": self.config.hnsw_construction_ef,
+            "hnsw:search_ef": self.config.hnsw_search_ef,
+        }
+
     async def upsert(self, chunk: Chunk) -> None:
         """Insert or update a chunk with its embedding."""
-        if chunk.embedding is None:
+        await self.upsert_many([chunk])
+
+    async def upsert_many(self, chunks: list[Chunk]) -> None:
+        """
+        Insert or update several chunks with a single collection call.
+
+        The (synchronous) Chroma write runs in a worker thread so the event
+        loop keeps serving other I/O, such as the relational writes for the
+        same chunks.
+        """
+        if not chunks:
+            return
+        if any(chunk.embedding is None for chunk in chunks):
             raise ValueError("Chunk must have embedding before upserting")
 
+        await asyncio.to_thread(
+            self.collection.upsert,
+            ids=[str(chunk.id) for chunk in chunks],
+            embeddings=[chunk.embedding for chunk in chunks],
+            documents=[chunk.text for chunk in chunks],
+            metadatas=[self._chunk_metadata(chunk) for chunk in chunks],
+        )
+
+    @staticmethod
+    def _chunk_metadata(chunk: Chunk) -> dict:
         # Encode entity IDs as delimited string for filtering
         entity_ids_str = "|" + "|".join(str(eid) for eid in chunk.entity_ids) + "|" if chunk.entity_ids else ""
+        # Types in the same order as entity_ids ("" where unknown)
+        entity_types_str = "|".join(
+            chunk.entity_types[eid].value if eid in chunk.entity_types else ""
+            for eid in chunk.entity_ids
+        )
 
         metadata = {
             "source_id": str(chunk.source_id),
             "source_type": chunk.source_type.value,
             "entity_ids": entity_ids_str,
+            "entity_types": entity_types_str,
         }
+        # One flag per linked entity, so entity filters run inside the query
+        for eid in chunk.entity_ids:
+            metadata[f"ent_{eid}"] = True
         # Add any extra metadata (ChromaDB only supports str/int/float)
         for k, v in chunk.metadata.items():
             if isinstance(v, (str, int, float, bool)):
                 metadata[f"meta_{k}"] = v
-
-        self.collection.upsert(
-            ids=[str(chunk.id)],
-            embeddings=[chunk.embedding],
-            documents=[chunk.text],
-            metadatas=[metadata],
-        )
+        return metadata
 
     async def search(
         self,
-        query_embedding: list[float],
+        query_embedding: np.ndarray,
         limit: int = 10,
         filter_entity_ids: Optional[list[UUID]] = None,
     ) -> list[VectorSearchResult]:
-        """Search for similar chunks, optionally filtered by entity IDs."""
-        # ChromaDB doesn't support substring filtering, so we'll fetch more results
-        # and filter in Python if entity filters are provided
-        fetch_limit = limit * 3 if filter_entity_ids else limit
-
-        results = self.collection.query(
+        """Search for similar chunks, optionally filtered by entity IDs (any of)."""
+        # Chroma's client is synchronous; query from a worker thread so the
+        # event loop keeps serving other requests
+        results = await asyncio.to_thread(
+            self.collection.query,
             query_embeddings=[query_embedding],
-            n_results=fetch_limit,
+            n_results=limit,
+            where=self._entity_filter(filter_entity_ids),
         )
 
+        ids = results["ids"][0] if results["ids"] else []
+        if not ids:
+            return []
+        metadatas = results["metadatas"][0] if results["metadatas"] else [{}] * len(ids)
+        documents = results["documents"][0] if results["documents"] else [""] * len(ids)
+        distances = np.asarray(
+            results["distances"][0] if results["distances"] else np.zeros(len(ids))
+        )
+        # ChromaDB returns distances; convert to similarity for the whole batch
+        scores = (1.0 - distances if self.config.metric == "cosine" else -distances).tolist()
+
         search_results = []
-        filter_set = {str(eid) for eid in filter_entity_ids} if filter_entity_ids else None
-
-        if results["ids"] and results["ids"][0]:
-            for i, chunk_id in enumerate(results["ids"][0]):
-                meta = results["metadatas"][0][i] if results["metadatas"] else {}
-                distance = results["distances"][0][i] if results["distances"] else 0.0
-                doc = results["documents"][0][i] if results["documents"] else ""
-
-                # Parse entity IDs back from delimited string
-                entity_ids_str = meta.get("entity_ids", "")
-                entity_ids = []
-                if entity_ids_str:
-                    parts = entity_ids_str.strip("|").split("|")
-                    entity_ids = [UUID(p) for p in parts if p]
-
-                # Apply entity filter in Python
-                if filter_set:
-                    chunk_entity_strs = {str(eid) for eid in entity_ids}
-                    if not filter_set.intersection(chunk_entity_strs):
-                        continue
-
-                chunk = Chunk(
-                    id=UUID(chunk_id),
-                    text=doc,
-                    source_id=UUID(meta.get("source_id", "00000000-0000-0000-0000-000000000000")),
-                    source_type=SourceType(meta.get("source_type", "email")),
-                    entity_ids=entity_ids,
-                )
-
-                # ChromaDB returns distances; convert to similarity
-                score = 1.0 - distance if self.config.metric == "cosine" else -distance
-                search_results.append(VectorSearchResult(chunk=chunk, score=score))
-
-                if len(search_results) >= limit:
-                    break
+        for chunk_id, meta, doc, score in zip(ids, metadatas, documents, scores):
+            # Parse entity IDs back from delimited string
+            entity_ids_str = meta.get("entity_ids", "")
+            entity_ids = list(map(UUID, filter(None, entity_ids_str.split("|"))))
+            # Older records have no entity_types; leave their types unknown
+            type_parts = meta.get("entity_types", "").split("|")
+            entity_types = {}
+            if len(type_parts) == len(entity_ids):
+                entity_types = {
+                    eid: EntityType(t) for eid, t in zip(entity_ids, type_parts) if t
+                }
+
+            chunk = Chunk(
+                id=UUID(chunk_id),
+                text=doc,
+                source_id=UUID(meta.get("source_id", "00000000-0000-0000-0000-000000000000")),
+                source_type=SourceType(meta.get("source_type", "email")),
+                entity_ids=entity_ids,
+                entity_types=entity_types,
+            )
+            search_results.append(VectorSearchResult(chunk=chunk, score=score))
 
         return search_results
 
+    @staticmethod
+    def _entity_filter(entity_ids: Optional[list[UUID]]) -> Optional[dict]:
+        """Chroma `where` clause matching chunks linked to any of the entities."""
+        if not entity_ids:
+            return None
+        clauses = [{f"ent_{eid}": True} for eid in dict.fromkeys(entity_ids)]
+        return clauses[0] if len(clauses) == 1 else {"$or": clauses}
+
     async def delete(self, chunk_id: UUID) -> None:
         """Delete a chunk from the store."""
-        self.collection.delete(ids=[str(chunk_id)])
+        await asyncio.to_thread(self.collection.delete, ids=[str(chunk_id)])
 
     def reset(self):
         """Delete the collection and recreate it (for testing)."""
         self.client.delete_collection(self.config.collection_name)
         self.collection = self.client.get_or_create_collection(
             name=self.config.collection_name,
-            metadata={"hnsw:space": self.config.metric},
+            metadata=self._collection_metadata(),
         )
@@ -0,0 +1,113 @@
+import asyncio
+import contextvars
+
+from src.models import Chunk, Interaction
+from src.storage.base import StorageBackend
+
+
+class WriteBatcher:
+    """
+    Coalesces concurrent relational writes into batched transactions.
+
+    Callers enqueue interactions and chunks; a single background worker
+    drains up to `max_batch` rows (waiting at most `window_ms` after the
+    first one arrives) into one `save_interactions` and one `save_chunks`
+    call. Each caller's await returns once its rows are committed. Exposes
+    the same save methods as StorageBackend so the pipeline can use either.
+    Calls made inside a storage transaction() block bypass the queue and
+    are written in that transaction.
+    """
+
+    def __init__(
+        self,
+        storage: StorageBackend,
+        max_batch: int = 500,
+        window_ms: float = 50.0,
+        max_pending: int = 10_000,
+    ):
+        self.storage = storage
+        self.max_batch = max_batch
+        self.window = window_ms / 1000
+        self.max_pending = max_pending
+        self._queue: asyncio.Queue | None = None
+        self._worker: asyncio.Task | None = None
+
+    async def save_interaction(self, interaction: Interaction) -> None:
+        await self._submit("interactions", [interaction])
+
+    async def save_interactions(self, interactions: list[Interaction]) -> None:
+        await self._submit("interactions", interactions)
+
+    async def save_chunks(self, chunks: list[Chunk]) -> None:
+        await self._submit("chunks", chunks)
+
+    async def close(self) -> None:
+        """Flush pending writes, then stop the background worker."""
+        if self._queue is not None and self._worker is not None and not self._worker.done():
+            await self._queue.join()
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+    async def _submit(self, kind: str, items: list) -> None:
+        if not items:
+            return
+        if self.storage.in_transaction():
+            # The caller's transaction() block holds the connection (and on
+            # SQLite the write lock) the worker would need; write in it
+            await getattr(self.storage, f"save_{kind}")(items)
+            return
+        if self._queue is None:
+            # Bounded, so producers wait rather than buffering without limit
+            self._queue = asyncio.Queue(maxsize=self.max_pending)
+        if self._worker is None or self._worker.done():
+            # Fresh context, so the long-lived worker never inherits (and
+            # keeps reusing) the session of a caller's transaction() block
+            self._worker = asyncio.create_task(self._run(), context=contextvars.Context())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((kind, items, future))
+        await future
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            ops = [await self._queue.get()]
+            rows = len(ops[0][1])
+            deadline = loop.time() + self.window
+            while rows < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    op = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                ops.append(op)
+                rows += len(op[1])
+
+            try:
+                # Interactions first, so chunks never reference a source
+                # that isn't stored yet
+                for kind, save in (
+                    ("interactions", self.storage.save_interactions),
+                    ("chunks", self.storage.save_chunks),
+                ):
+                    items = [item for k, batch, _ in ops if k == kind for item in batch]
+                    if items:
+                        await save(items)
+            except Exception as e:
+                for _, _, future in ops:
+                    if not future.done():
+                        future.set_exception(e)
+            else:
+                for _, _, future in ops:
+                    if not future.done():
+                        future.set_result(None)
+            finally:
+                for _ in ops:
+                    self._queue.task_done()
@@ -5,7 +5,10 @@ import os
 import re
 import tempfile
 from unittest.mock import AsyncMock
+from uuid import uuid4
 
+import ahocorasick
+import chromadb
 import pytest
 import pytest_asyncio
 
@@ -29,13 +32,17 @@ _KNOWN_COMPANIES = {
     "Hugging Face", "Domino Data Lab", "Cohere",
 }
 
+# One automaton over the lowercased names, so each text is scanned once
+_COMPANY_AUTOMATON = ahocorasick.Automaton()
+for _name in _KNOWN_COMPANIES:
+    _COMPANY_AUTOMATON.add_word(_name.lower(), _name)
+_COMPANY_AUTOMATON.make_automaton()
+
 
 def _fake_llm_extract(text: str) -> tuple[list[str], list[str]]:
     """Simple pattern-based extraction that mimics what the LLM would return."""
-    companies = []
-    for name in _KNOWN_COMPANIES:
-        if name.lower() in text.lower():
-            companies.append(name)
+    # dict.fromkeys dedups while keeping first-occurrence order
+    companies = list(dict.fromkeys(name for _, name in _COMPANY_AUTOMATON.iter(text.lower())))
 
     people = []
     for match in _PERSON_PATTERN.finditer(text):
@@ -58,21 +65,27 @@ async def storage(tmp_path):
     await store.close()
 
 
+@pytest.fixture(scope="session")
+def chroma_client(tmp_path_factory):
+    """One Chroma client for the whole run; starting one is the slow part."""
+    return chromadb.PersistentClient(path=str(tmp_path_factory.mktemp("chroma")))
+
+
 @pytest.fixture
-def vector_store(tmp_path):
-    """Provide a fresh vector store for each test."""
+def vector_store(chroma_client):
+    """Provide a fresh vector store (its own collection) for each test."""
     config = VectorStoreConfig(
-        collection_name="test_collection",
+        collection_name=f"test_{uuid4().hex}",
         embedding_dimension=384,
-        persist_directory=str(tmp_path / "chroma"),
     )
-    vs = VectorStore(config)
+    vs = VectorStore(config, client=chroma_client)
     yield vs
+    chroma_client.delete_collection(config.collection_name)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def embedding_service():
-    """Provide the local embedding service."""
+    """Provide the local embedding service, shared so its model and vector cache load once."""
     return EmbeddingService(backend="local")
 
 
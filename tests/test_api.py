@@ -132,3 +132,51 @@ async def test_company_context_not_found(api_deps):
 
     company = await storage.get_company(UUID("00000000-0000-0000-0000-000000000000"))
     assert company is None
+
+
+@pytest.mark.asyncio
+async def test_health_short_circuits_router():
+    from fastapi import FastAPI
+    from src.api.routes import HealthShortCircuit
+
+    app = FastAPI()
+    app.add_middleware(HealthShortCircuit)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        health = await client.get("/health")
+        missing = await client.get("/missing")
+
+    assert health.status_code == 200
+    assert health.json() == {"status": "ok"}
+    assert missing.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_lifespan_sizes_stores_from_embedding_dimension(tmp_path, monkeypatch):
+    import numpy as np
+    from src.api import routes
+
+    class _WideEmbeddingService:
+        """Stands in for the OpenAI backend: 1536-dim vectors, no network."""
+        dimension = 1536
+
+        def __init__(self, backend="local"):
+            pass
+
+        async def embed(self, text):
+            return (await self.embed_batch([text]))[0]
+
+        async def embed_batch(self, texts):
+            return [np.full(self.dimension, 1 / np.sqrt(self.dimension), dtype=np.float32) for _ in texts]
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr(routes, "EmbeddingService", _WideEmbeddingService)
+
+    app = routes.create_app()
+    async with app.router.lifespan_context(app):
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.get("/search", params={"query": "fintech payments"})
+
+    assert response.status_code == 200
+    assert response.json() == []
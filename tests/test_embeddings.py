@@ -5,8 +5,9 @@ import pytest
 
 @pytest.mark.asyncio
 async def test_embed_returns_correct_dimension(embedding_service):
+    import numpy as np
     result = await embedding_service.embed("Hello world")
-    assert isinstance(result, list)
+    assert isinstance(result, np.ndarray)
     assert len(result) == 384  # all-MiniLM-L6-v2 dimension
 
 
@@ -35,3 +36,100 @@ async def test_similar_texts_have_high_similarity(embedding_service):
     sim_related = np.dot(e1, e2)
     sim_unrelated = np.dot(e1, e3)
     assert sim_related > sim_unrelated
+
+
+@pytest.mark.asyncio
+async def test_batcher_coalesces_concurrent_requests(embedding_service, monkeypatch):
+    import asyncio
+    from src.embeddings import AsyncBatcher
+
+    calls = []
+    original = embedding_service.embed_batch
+
+    async def _counting_embed_batch(texts):
+        calls.append(len(texts))
+        return await original(texts)
+
+    # The fixture is session-scoped; monkeypatch restores it afterwards
+    monkeypatch.setattr(embedding_service, "embed_batch", _counting_embed_batch)
+    batcher = AsyncBatcher(embedding_service, max_batch=32, window_ms=20)
+
+    texts = [f"query number {i}" for i in range(8)]
+    results = await asyncio.gather(*(batcher.embed(t) for t in texts))
+    await batcher.close()
+
+    assert len(results) == 8
+    assert all(len(r) == 384 for r in results)
+    assert sum(calls) == 8
+    assert len(calls) < 8
+
+
+@pytest.mark.asyncio
+async def test_batcher_matches_direct_embedding(embedding_service):
+    import numpy as np
+    from src.embeddings import AsyncBatcher
+
+    batcher = AsyncBatcher(embedding_service)
+    batched = await batcher.embed("enterprise software company")
+    await batcher.close()
+
+    # Drop the cached vector so the direct call really encodes again
+    embedding_service._cache.clear()
+    direct = await embedding_service.embed("enterprise software company")
+    assert direct is not batched
+    assert np.allclose(batched, direct, atol=1e-5)
+
+
+@pytest.mark.asyncio
+async def test_int8_quantization_preserves_similarity(embedding_service):
+    import numpy as np
+    from src.embeddings import int8_similarity, quantize_int8
+
+    e1 = await embedding_service.embed("enterprise software company")
+    e2 = await embedding_service.embed("business SaaS platform")
+    packed = await embedding_service.embed_int8("enterprise software company")
+
+    assert len(packed) == 384
+    q1 = np.frombuffer(packed, dtype=np.int8)
+    approx = int8_similarity(q1[np.newaxis, :], quantize_int8(e2))[0]
+    assert abs(approx - np.dot(e1, e2)) < 0.02
+
+
+@pytest.mark.asyncio
+async def test_openai_backend_chunks_large_batches():
+    from types import SimpleNamespace
+    from unittest.mock import AsyncMock
+    from src.embeddings import EmbeddingService
+
+    service = EmbeddingService(backend="openai", api_key="test-key", openai_chunk_size=2)
+
+    async def _create(model, input):
+        return SimpleNamespace(data=[SimpleNamespace(embedding=[float(len(t))] * 3) for t in input])
+
+    service._client.embeddings.create = AsyncMock(side_effect=_create)
+    texts = ["a", "bb", "ccc", "dddd", "eeeee"]
+    results = await service.embed_batch(texts)
+
+    assert service._client.embeddings.create.await_count == 3
+    assert [r[0] for r in results] == [1.0, 2.0, 3.0, 4.0, 5.0]
+    assert (await service.embed("xyz"))[0] == 3.0
+
+
+@pytest.mark.asyncio
+async def test_embed_batch_reuses_cached_vectors():
+    from types import SimpleNamespace
+    from unittest.mock import AsyncMock
+    from src.embeddings import EmbeddingService
+
+    service = EmbeddingService(backend="openai", api_key="test-key")
+
+    async def _create(model, input):
+        return SimpleNamespace(data=[SimpleNamespace(embedding=[float(len(t))] * 3) for t in input])
+
+    service._client.embeddings.create = AsyncMock(side_effect=_create)
+    await service.embed_batch(["a", "bb"])
+    results = await service.embed_batch(["bb", "ccc", "ccc"])
+
+    assert [r[0] for r in results] == [2.0, 3.0, 3.0]
+    # Second call only sent the one text not seen before
+    assert service._client.embeddings.create.await_args.kwargs["input"] == ["ccc"]
@@ -2,7 +2,7 @@
 
 import pytest
 
-from src.models import EntityType
+from src.models import Company, EntityType
 from src.entities.extractor import ExtractedEntity
 
 
@@ -61,3 +61,35 @@ async def test_link_entity_dispatches_correctly(entity_linker):
     )
     entity = await entity_linker.link_entity(person_ext)
     assert entity.entity_type == EntityType.PERSON
+
+
+@pytest.mark.asyncio
+async def test_concurrent_links_do_not_duplicate(entity_linker, storage):
+    import asyncio
+
+    companies = await asyncio.gather(*(entity_linker.link_company(name="RaceCorp") for _ in range(5)))
+    assert len({c.id for c in companies}) == 1
+    assert len(await storage.search_companies_by_name("RaceCorp")) == 1
+
+
+@pytest.mark.asyncio
+async def test_link_entities_bulk_matches_sequential_linking(entity_linker, storage):
+    existing = Company(name="NovaBuild", url="https://novabuild.io")
+    await storage.save_company(existing)
+
+    mentions = [
+        ExtractedEntity("Nova Build Inc", EntityType.COMPANY, 0, 0, metadata={"url": "https://novabuild.io"}),
+        ExtractedEntity("PayLoop", EntityType.COMPANY, 0, 0),
+        ExtractedEntity("Sarah Chen", EntityType.PERSON, 0, 0, metadata={"email": "sarah@novabuild.io"}),
+        ExtractedEntity("Payloop", EntityType.COMPANY, 0, 0),
+        ExtractedEntity("Sarah", EntityType.PERSON, 0, 0),
+        ExtractedEntity("novabuild", EntityType.COMPANY, 0, 0),
+    ]
+    linked = await entity_linker.link_entities_bulk(mentions)
+
+    assert linked[0].id == existing.id
+    assert linked[3].id == linked[1].id  # matches the company created for "PayLoop"
+    assert linked[4].id == linked[2].id
+    assert linked[5].id == existing.id
+    assert len(await storage.list_companies()) == 2
+    assert (await storage.get_person_by_email("sarah@novabuild.io")).id == linked[2].id
@@ -124,3 +124,96 @@ async def test_linkedin_extraction(entity_extractor):
         assert any("John Doe" in e.text for e in people)
         assert any(e.metadata and "linkedin_url" in e.metadata for e in companies)
         assert any(e.metadata and "linkedin_url" in e.metadata for e in people)
+
+
+@pytest.mark.asyncio
+async def test_llm_entity_positions(entity_extractor):
+    with patch.object(entity_extractor.client.chat.completions, "create",
+                      new=AsyncMock(return_value=_mock_llm_response(["Nova", "NovaBuild", "Acme"], ["Sarah Chen"]))):
+        text = "NovaBuild (not Nova Labs) hired SARAH CHEN."
+        entities = {e.text: e for e in await entity_extractor.extract(text)}
+        assert (entities["NovaBuild"].start_pos, entities["NovaBuild"].end_pos) == (0, 9)
+        assert entities["Nova"].start_pos == 0
+        assert entities["Sarah Chen"].start_pos == text.index("SARAH CHEN")
+        assert (entities["Acme"].start_pos, entities["Acme"].end_pos) == (0, 0)
+
+
+@pytest.mark.asyncio
+async def test_repeated_text_skips_llm_call(entity_extractor):
+    create = AsyncMock(return_value=_mock_llm_response(["Google"], []))
+    with patch.object(entity_extractor.client.chat.completions, "create", new=create):
+        text = "We had a meeting with Google."
+        first = await entity_extractor.extract(text)
+        second = await entity_extractor.extract(text)
+        await entity_extractor.extract("A different note about Google.")
+
+    assert [e.text for e in first] == [e.text for e in second]
+    assert create.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_lowercase_text_skips_llm_call(entity_extractor):
+    create = AsyncMock(return_value=_mock_llm_response([], []))
+    with patch.object(entity_extractor.client.chat.completions, "create", new=create):
+        entities = await entity_extractor.extract("ping sarah.chen@novabuild.io about the follow-up")
+
+    assert create.await_count == 0
+    assert any(e.metadata and "email" in e.metadata for e in entities)
+
+
+@pytest.mark.asyncio
+async def test_extract_many_extracts_each_distinct_text_once(entity_extractor):
+    create = AsyncMock(return_value=_mock_llm_response(["Google"], []))
+    with patch.object(entity_extractor.client.chat.completions, "create", new=create):
+        texts = ["Met Google today.", "Met Google today.", "Google called back."]
+        results = await entity_extractor.extract_many(texts)
+
+    assert len(results) == 3
+    assert all([e.text for e in r] == ["Google"] for r in results)
+    assert create.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_extract_document_uses_one_llm_call(entity_extractor):
+    create = AsyncMock(return_value=_mock_llm_response(["NovaBuild", "Acme Holdings"], ["Sarah Chen"]))
+    chunks = ["NovaBuild is building construction software.", "Sarah Chen is the CEO of NovaBuild."]
+    with patch.object(entity_extractor.client.chat.completions, "create", new=create):
+        results = await entity_extractor.extract_document("\n\n".join(chunks), chunks)
+
+    assert create.await_count == 1
+    assert [e.text for e in results[0]] == ["NovaBuild", "Acme Holdings"]
+    assert [e.text for e in results[1]] == ["NovaBuild", "Sarah Chen"]
+    assert results[1][1].start_pos == 0
+
+
+@pytest.mark.asyncio
+async def test_extract_document_splits_long_text_into_windows(entity_extractor):
+    entity_extractor.max_window_chars = 60
+    responses = {
+        "NovaBuild": _mock_llm_response(["NovaBuild"], []),
+        "Sarah Chen": _mock_llm_response([], ["Sarah Chen"]),
+    }
+
+    async def _create(model, messages, **kwargs):
+        # Each window's prompt holds only its own chunk
+        return next(r for name, r in responses.items() if name in messages[-1]["content"])
+
+    chunks = ["NovaBuild is building construction software.", "Sarah Chen joined the board last week."]
+    with patch.object(entity_extractor.client.chat.completions, "create", new=AsyncMock(side_effect=_create)) as create:
+        results = await entity_extractor.extract_document("\n\n".join(chunks), chunks)
+
+    assert create.await_count == 2
+    assert [e.text for e in results[0]] == ["NovaBuild"]
+    assert [e.text for e in results[1]] == ["Sarah Chen"]
+
+
+@pytest.mark.asyncio
+async def test_fast_only_skips_llm_and_keeps_regex_matches(entity_extractor):
+    entity_extractor.fast_only = True
+    create = AsyncMock(return_value=_mock_llm_response(["NovaBuild"], ["Sarah Chen"]))
+    with patch.object(entity_extractor.client.chat.completions, "create", new=create):
+        entities = await entity_extractor.extract("Sarah Chen of NovaBuild: sarah.chen@novabuild.io")
+
+    assert create.await_count == 0
+    assert all(e.metadata and "email" in e.metadata for e in entities)
+    assert entities
@@ -70,3 +70,89 @@ async def test_entities_are_extracted_and_linked(pipeline, storage):
     # Sarah Chen should be deduplicated
     sarahs = await storage.search_people_by_name("Sarah Chen")
     assert len(sarahs) <= 1  # 0 or 1 depending on NER
+
+
+@pytest.mark.asyncio
+async def test_ingest_bumps_entity_versions(pipeline, storage):
+    await pipeline.ingest_artifact(
+        raw_text="NovaBuild closed a new enterprise customer.",
+        source_type=SourceType.DOCUMENT,
+    )
+    company = (await storage.search_companies_by_name("NovaBuild"))[0]
+    assert pipeline.entity_versions[company.id] == 1
+
+    await pipeline.ingest_artifact(
+        raw_text="NovaBuild expanded to a second region.",
+        source_type=SourceType.DOCUMENT,
+    )
+    assert pipeline.entity_versions[company.id] == 2
+
+
+@pytest.mark.asyncio
+async def test_ingest_links_each_mention_once_per_document(pipeline, storage):
+    calls = []
+    original = pipeline.entity_linker.link_entities_bulk
+
+    async def _recording_link_entities_bulk(extracted):
+        calls.append([ext.text for ext in extracted])
+        return await original(extracted)
+
+    pipeline.entity_linker.link_entities_bulk = _recording_link_entities_bulk
+    paragraph = "NovaBuild shipped a new release and the pipeline keeps growing. " * 12
+    artifact = await pipeline.ingest_artifact(
+        raw_text="\n\n".join([paragraph] * 4),
+        source_type=SourceType.DOCUMENT,
+    )
+
+    chunks = await storage.get_chunks_by_source(artifact.id)
+    assert len(chunks) > 1
+    assert calls == [["NovaBuild"]]
+    assert len({tuple(c.entity_ids) for c in chunks}) == 1
+
+
+@pytest.mark.asyncio
+async def test_bulk_ingest_buffers_chunk_writes(pipeline, storage):
+    from src.ingestion.pipeline import BulkOptions
+
+    async with pipeline.bulk(BulkOptions(batch_size=2)):
+        artifacts = [
+            await pipeline.ingest_artifact(
+                raw_text=f"NovaBuild update number {i}.",
+                source_type=SourceType.DOCUMENT,
+            )
+            for i in range(3)
+        ]
+        # The first two chunks filled a batch; the third is still buffered
+        assert len(await storage.get_chunks_by_source(artifacts[0].id)) == 1
+        assert await storage.get_chunks_by_source(artifacts[2].id) == []
+
+    for artifact in artifacts:
+        assert len(await storage.get_chunks_by_source(artifact.id)) == 1
+    company = (await storage.search_companies_by_name("NovaBuild"))[0]
+    assert pipeline.entity_versions[company.id] == 3
+
+
+@pytest.mark.asyncio
+async def test_bulk_only_buffers_ingests_inside_the_block(pipeline, storage):
+    import asyncio
+
+    entered, release = asyncio.Event(), asyncio.Event()
+
+    async def _bulk_load():
+        async with pipeline.bulk():
+            await pipeline.ingest_artifact(raw_text="Buffered update.", source_type=SourceType.DOCUMENT)
+            entered.set()
+            await release.wait()
+
+    loader = asyncio.create_task(_bulk_load())
+    await entered.wait()
+
+    # A concurrent ingest outside the block is written immediately
+    artifact = await pipeline.ingest_artifact(raw_text="Direct update.", source_type=SourceType.DOCUMENT)
+    assert len(await storage.get_chunks_by_source(artifact.id)) == 1
+    # and a second bulk load in another task doesn't collide with the first
+    async with pipeline.bulk():
+        pass
+
+    release.set()
+    await loader
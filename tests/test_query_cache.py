@@ -0,0 +1,70 @@
+"""Tests for the semantic query cache."""
+
+import pytest
+
+from src.search.cache import SemanticQueryCache
+
+
+@pytest.mark.asyncio
+async def test_cache_hits_for_same_query(embedding_service):
+    cache = SemanticQueryCache(dimension=384)
+    emb = await embedding_service.embed("enterprise software")
+    cache.put(emb, (10, None, None), ["cached"])
+
+    assert cache.get(emb, (10, None, None)) == ["cached"]
+
+
+@pytest.mark.asyncio
+async def test_cache_misses_for_different_filters_or_query(embedding_service):
+    cache = SemanticQueryCache(dimension=384)
+    emb = await embedding_service.embed("enterprise software")
+    cache.put(emb, (10, None, None), ["cached"])
+
+    assert cache.get(emb, (5, None, None)) is None
+    other = await embedding_service.embed("cute fluffy puppies")
+    assert cache.get(other, (10, None, None)) is None
+
+
+@pytest.mark.asyncio
+async def test_cache_evicts_least_recently_used(embedding_service):
+    cache = SemanticQueryCache(dimension=384, max_size=2)
+    e1 = await embedding_service.embed("fintech payments")
+    e2 = await embedding_service.embed("construction management")
+    e3 = await embedding_service.embed("vector database")
+
+    cache.put(e1, None, ["one"])
+    cache.put(e2, None, ["two"])
+    cache.get(e1, None)  # touch e1 so e2 is evicted next
+    cache.put(e3, None, ["three"])
+
+    assert len(cache) == 2
+    assert cache.get(e1, None) == ["one"]
+    assert cache.get(e2, None) is None
+    assert cache.get(e3, None) == ["three"]
+
+
+@pytest.mark.asyncio
+async def test_cache_stats_count_hits_and_misses(embedding_service):
+    cache = SemanticQueryCache(dimension=384)
+    emb = await embedding_service.embed("fintech payments")
+
+    assert cache.get(emb, None) is None
+    cache.put(emb, None, ["cached"])
+    assert cache.get(emb, None) == ["cached"]
+
+    assert cache.stats() == {"size": 1, "hits": 1, "misses": 1}
+
+
+@pytest.mark.asyncio
+async def test_cache_drops_results_from_before_a_clear(embedding_service):
+    cache = SemanticQueryCache(dimension=384)
+    emb = await embedding_service.embed("fintech payments")
+
+    generation = cache.generation
+    # An ingest lands while the search is running
+    cache.clear()
+    cache.put(emb, None, ["stale"], generation)
+    assert cache.get(emb, None) is None
+
+    cache.put(emb, None, ["fresh"], cache.generation)
+    assert cache.get(emb, None) == ["fresh"]
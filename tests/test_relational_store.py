@@ -128,3 +128,387 @@ async def test_get_chunks_by_source(storage):
 
     chunks = await storage.get_chunks_by_source(source_id)
     assert len(chunks) == 2
+
+
+@pytest.mark.asyncio
+async def test_file_database_uses_wal(tmp_path):
+    from sqlalchemy import text
+    from src.storage.relational import RelationalStore
+
+    store = RelationalStore(f"sqlite+aiosqlite:///{tmp_path / 'wal.db'}")
+    await store.initialize()
+    async with store.engine.connect() as conn:
+        mode = (await conn.execute(text("PRAGMA journal_mode"))).scalar()
+        sync = (await conn.execute(text("PRAGMA synchronous"))).scalar()
+    await store.close()
+
+    assert mode == "wal"
+    assert sync == 1  # NORMAL
+
+
+@pytest.mark.asyncio
+async def test_list_people_with_company(storage):
+    company = Company(name="JoinCorp")
+    await storage.save_company(company)
+    await storage.save_person(Person(name="Dana Joined", company_id=company.id))
+    await storage.save_person(Person(name="Eve Solo"))
+
+    rows = await storage.list_people_with_company()
+    by_name = {p.name: c for p, c in rows}
+    assert by_name["Dana Joined"].name == "JoinCorp"
+    assert by_name["Eve Solo"] is None
+
+    rows = await storage.list_people_with_company("Dana")
+    assert [p.name for p, _ in rows] == ["Dana Joined"]
+
+
+@pytest.mark.asyncio
+async def test_file_database_reads_use_readonly_engine(tmp_path):
+    from sqlalchemy import text
+    from sqlalchemy.exc import OperationalError
+    from src.storage.relational import RelationalStore
+
+    store = RelationalStore(f"sqlite+aiosqlite:///{tmp_path / 'ro.db'}")
+    await store.initialize()
+    assert store.read_engine is not store.engine
+
+    company = Company(name="ReadCorp")
+    await store.save_company(company)
+    assert (await store.get_company(company.id)).name == "ReadCorp"
+
+    with pytest.raises(OperationalError, match="readonly"):
+        async with store.read_engine.begin() as conn:
+            await conn.execute(text("DELETE FROM companies"))
+    await store.close()
+
+
+@pytest.mark.asyncio
+async def test_bulk_entity_lookups(storage):
+    nova = Company(name="NovaBuild", url="https://novabuild.io")
+    pay = Company(name="PayLoop", linkedin_url="https://www.linkedin.com/company/payloop")
+    await storage.save_company(nova)
+    await storage.save_company(pay)
+    alice = Person(name="Alice Smith", email="alice@example.com")
+    await storage.save_person(alice)
+
+    by_url = await storage.get_companies_by_urls(["https://novabuild.io", "https://missing.io"])
+    assert [c.id for c in by_url] == [nova.id]
+    by_linkedin = await storage.get_companies_by_linkedin_urls(["https://www.linkedin.com/company/payloop"])
+    assert [c.id for c in by_linkedin] == [pay.id]
+    assert await storage.get_companies_by_urls([]) == []
+
+    by_name = await storage.search_companies_by_names(["nova", "PayLoop", "Nothing"])
+    assert by_name["nova"].id == nova.id
+    assert by_name["PayLoop"].id == pay.id
+    assert "Nothing" not in by_name
+
+    people = await storage.get_people_by_emails(["alice@example.com"])
+    assert [p.id for p in people] == [alice.id]
+    assert (await storage.search_people_by_names(["Alice"]))["Alice"].id == alice.id
+
+
+@pytest.mark.asyncio
+async def test_get_entities_bulk(storage):
+    company = Company(name="BulkCo")
+    person = Person(name="Bulk Person")
+    theme = Theme(name="bulk-theme")
+    await storage.save_company(company)
+    await storage.save_person(person)
+    await storage.save_theme(theme)
+
+    missing = Company(name="Unsaved")
+    entities = await storage.get_entities_bulk([company.id, person.id, theme.id, missing.id])
+
+    assert set(entities) == {company.id, person.id, theme.id}
+    assert isinstance(entities[company.id], Company)
+    assert entities[person.id].name == "Bulk Person"
+    assert isinstance(entities[theme.id], Theme)
+    assert await storage.get_entities_bulk([]) == {}
+
+
+@pytest.mark.asyncio
+async def test_chunk_entity_types_round_trip(storage):
+    from src.models import EntityType
+
+    company = Company(name="TypedCo")
+    person = Person(name="Typed Person")
+    await storage.save_company(company)
+    await storage.save_person(person)
+    untyped = Company(name="UntypedCo")
+    await storage.save_company(untyped)
+
+    chunk = Chunk(
+        text="TypedCo met Typed Person",
+        source_type=SourceType.DOCUMENT,
+        entity_ids=[company.id, person.id, untyped.id],
+        entity_types={company.id: EntityType.COMPANY, person.id: EntityType.PERSON},
+    )
+    await storage.save_chunk(chunk)
+
+    loaded = (await storage.get_chunks_by_source(chunk.source_id))[0]
+    assert loaded.entity_types == {company.id: EntityType.COMPANY, person.id: EntityType.PERSON}
+
+    entities = await storage.get_entities_bulk(loaded.entity_ids, loaded.entity_types)
+    assert set(entities) == {company.id, person.id, untyped.id}
+
+
+@pytest.mark.asyncio
+async def test_save_chunks_upserts_in_batches(storage):
+    source_id = Interaction().id
+    company = Company(name="UpsertCo")
+    await storage.save_company(company)
+    chunks = [
+        Chunk(text=f"chunk {i}", source_id=source_id, entity_ids=[company.id])
+        for i in range(5)
+    ]
+    await storage.save_chunks(chunks, batch_size=2)
+
+    chunks[0].text = "chunk 0 revised"
+    await storage.save_chunks(chunks[:1])
+
+    loaded = {c.id: c for c in await storage.get_chunks_by_source(source_id)}
+    assert len(loaded) == 5
+    assert loaded[chunks[0].id].text == "chunk 0 revised"
+    assert loaded[chunks[0].id].entity_ids == [company.id]
+
+
+@pytest.mark.asyncio
+async def test_save_interactions(storage):
+    person = Person(name="Batch Person")
+    await storage.save_person(person)
+    interactions = [
+        Interaction(raw_text=f"note {i}", participants=[person.id]) for i in range(3)
+    ]
+    await storage.save_interactions(interactions)
+
+    for interaction in interactions:
+        loaded = await storage.get_interaction(interaction.id)
+        assert loaded.raw_text == interaction.raw_text
+        assert loaded.participants == [person.id]
+
+
+@pytest.mark.asyncio
+async def test_ids_are_stored_as_16_bytes(storage):
+    from sqlalchemy import text
+
+    company = Company(name="CompactCo")
+    await storage.save_company(company)
+
+    async with storage.engine.connect() as conn:
+        stored = (await conn.execute(text("SELECT id FROM companies"))).scalar()
+    assert stored == company.id.bytes
+    # String ids are still accepted by lookups
+    assert (await storage.get_company(str(company.id))).id == company.id
+
+
+def test_engine_options_ping_only_network_databases():
+    from src.storage.relational import RelationalStore
+
+    sqlite_opts = RelationalStore._engine_options("sqlite+aiosqlite:///file.db", pool_size=20)
+    assert sqlite_opts["pool_size"] == 20
+    assert "pool_pre_ping" not in sqlite_opts
+
+    pg_opts = RelationalStore._engine_options("postgresql+asyncpg://u@h/db")
+    assert pg_opts["pool_pre_ping"] is True
+    assert pg_opts["pool_recycle"] == 3600
+    assert pg_opts["connect_args"]["prepared_statement_cache_size"] == 256
+
+
+@pytest.mark.asyncio
+async def test_get_interactions_by_participant(storage):
+    alice = Person(name="Alice Participant")
+    bob = Person(name="Bob Participant")
+    await storage.save_person(alice)
+    await storage.save_person(bob)
+    await storage.save_interactions([
+        Interaction(raw_text="both", participants=[alice.id, bob.id]),
+        Interaction(raw_text="alice only", participants=[alice.id]),
+        Interaction(raw_text="bob only", participants=[bob.id]),
+    ])
+
+    alice_interactions = await storage.get_interactions_by_participant(alice.id)
+    assert {i.raw_text for i in alice_interactions} == {"both", "alice only"}
+    both = next(i for i in alice_interactions if i.raw_text == "both")
+    assert set(both.participants) == {alice.id, bob.id}
+    assert len(await storage.get_interactions_by_participant(alice.id, limit=1)) == 1
+
+
+@pytest.mark.asyncio
+async def test_write_batcher_coalesces_concurrent_writes(storage):
+    import asyncio
+    from src.storage.writer import WriteBatcher
+
+    calls = []
+    original = storage.save_chunks
+
+    async def _recording_save_chunks(chunks):
+        calls.append(len(chunks))
+        await original(chunks)
+
+    storage.save_chunks = _recording_save_chunks
+    writer = WriteBatcher(storage, window_ms=20)
+    interaction = Interaction(raw_text="batched")
+    chunk_groups = [
+        [Chunk(text=f"writer {i}-{j}", source_id=interaction.id) for j in range(2)]
+        for i in range(3)
+    ]
+    await asyncio.gather(
+        writer.save_interaction(interaction),
+        *(writer.save_chunks(group) for group in chunk_groups),
+    )
+    await writer.close()
+
+    assert calls == [6]
+    assert (await storage.get_interaction(interaction.id)).raw_text == "batched"
+    assert len(await storage.get_chunks_by_source(interaction.id)) == 6
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("database", ["memory", "file"])
+async def test_write_batcher_inside_transaction(tmp_path, database):
+    import asyncio
+    from src.storage.relational import RelationalStore
+    from src.storage.writer import WriteBatcher
+
+    path = ":memory:" if database == "memory" else tmp_path / "writer.db"
+    store = RelationalStore(f"sqlite+aiosqlite:///{path}")
+    await store.initialize()
+    writer = WriteBatcher(store, window_ms=1)
+
+    # A write before the writer call holds the block's connection and
+    # SQLite write lock; the writer must join the block, not wait on it
+    company = Company(name="TxnWriter")
+    first = Interaction(raw_text="first")
+    async with store.transaction():
+        await store.save_company(company)
+        await asyncio.wait_for(writer.save_interaction(first), timeout=5)
+    # After the block, the queued path commits on its own
+    second = Interaction(raw_text="second")
+    await writer.save_interaction(second)
+    await writer.close()
+
+    assert await store.get_company(company.id) is not None
+    assert (await store.get_interaction(first.id)).raw_text == "first"
+    assert (await store.get_interaction(second.id)).raw_text == "second"
+    await store.close()
+
+
+@pytest.mark.asyncio
+async def test_save_artifact_links_related_companies(storage):
+    from sqlalchemy import select
+    from src.storage.models import artifact_companies
+
+    companies = [Company(name="LinkA"), Company(name="LinkB")]
+    for company in companies:
+        await storage.save_company(company)
+    artifact = Artifact(raw_text="memo", related_companies=[c.id for c in companies])
+    await storage.save_artifact(artifact)
+
+    async with storage.engine.connect() as conn:
+        rows = (await conn.execute(
+            select(artifact_companies.c.company_id)
+            .where(artifact_companies.c.artifact_id == artifact.id)
+        )).scalars().all()
+    assert set(rows) == {c.id for c in companies}
+
+
+@pytest.mark.asyncio
+async def test_transaction_commits_once_and_rolls_back_on_error(storage):
+    kept = Company(name="TxnKept")
+    async with storage.transaction():
+        await storage.save_company(kept)
+        await storage.save_person(Person(name="Txn Person", company_id=kept.id))
+        # Reads inside the block see its uncommitted writes
+        assert (await storage.get_company(kept.id)).name == "TxnKept"
+    assert await storage.get_company(kept.id) is not None
+
+    dropped = Company(name="TxnDropped")
+    with pytest.raises(RuntimeError):
+        async with storage.transaction():
+            await storage.save_company(dropped)
+            raise RuntimeError("abort")
+    assert await storage.get_company(dropped.id) is None
+
+
+@pytest.mark.asyncio
+async def test_name_search_uses_trigram_index(storage):
+    from sqlalchemy import text
+
+    assert storage._name_fts
+    company = Company(name="Trigram Dynamics")
+    await storage.save_company(company)
+    assert [c.id for c in await storage.search_companies_by_name("gram dyn")] == [company.id]
+
+    async with storage.engine.begin() as conn:
+        await conn.execute(text("UPDATE companies SET name = 'Renamed Labs'"))
+    assert await storage.search_companies_by_name("Trigram") == []
+    assert [c.id for c in await storage.search_companies_by_name("renamed")] == [company.id]
+
+
+def _write_text_id_database(path, company_id, person_id, interaction_id):
+    """A database as written before ids became 16-byte UUIDs."""
+    import sqlite3
+
+    with sqlite3.connect(path) as conn:
+        conn.executescript("""
+            CREATE TABLE companies (
+                id VARCHAR(36) PRIMARY KEY, name VARCHAR(255) NOT NULL, url VARCHAR(512),
+                linkedin_url VARCHAR(512), description TEXT, created_at DATETIME
+            );
+            CREATE TABLE people (
+                id VARCHAR(36) PRIMARY KEY, name VARCHAR(255) NOT NULL, linkedin_url VARCHAR(512),
+                email VARCHAR(255), company_id VARCHAR(36), created_at DATETIME
+            );
+            CREATE TABLE interactions (
+                id VARCHAR(36) PRIMARY KEY, source_type VARCHAR(50) NOT NULL, raw_text TEXT NOT NULL,
+                timestamp DATETIME, metadata_json TEXT, created_at DATETIME
+            );
+            CREATE TABLE interaction_participants (
+                interaction_id VARCHAR(36), person_id VARCHAR(36),
+                PRIMARY KEY (interaction_id, person_id)
+            );
+        """)
+        now = "2024-01-01 00:00:00.000000"
+        conn.execute("INSERT INTO companies VALUES (?, 'LegacyCo', NULL, NULL, NULL, ?)", (str(company_id), now))
+        conn.execute(
+            "INSERT INTO people VALUES (?, 'Legacy Person', NULL, NULL, ?, ?)",
+            (str(person_id), str(company_id), now),
+        )
+        conn.execute(
+            "INSERT INTO interactions VALUES (?, 'email', 'hello', ?, '{\"subject\": \"hi\"}', ?)",
+            (str(interaction_id), now, now),
+        )
+        conn.execute(
+            "INSERT INTO interaction_participants VALUES (?, ?)", (str(interaction_id), str(person_id))
+        )
+
+
+@pytest.mark.asyncio
+async def test_text_id_database_is_rejected_then_converted(tmp_path):
+    from uuid import uuid4
+    from src.storage.legacy import LegacySchemaError, convert_text_ids
+    from src.storage.relational import RelationalStore
+
+    path = tmp_path / "legacy.db"
+    company_id, person_id, interaction_id = uuid4(), uuid4(), uuid4()
+    _write_text_id_database(path, company_id, person_id, interaction_id)
+
+    store = RelationalStore(f"sqlite+aiosqlite:///{path}")
+    with pytest.raises(LegacySchemaError, match="convert_text_ids"):
+        await store.initialize()
+    await store.close()
+
+    # Conversion runs its own event loop, as the CLI script does
+    import asyncio
+    backup = await asyncio.to_thread(convert_text_ids, path)
+    assert backup.exists()
+
+    store = RelationalStore(f"sqlite+aiosqlite:///{path}")
+    await store.initialize()
+    assert (await store.get_company(company_id)).name == "LegacyCo"
+    assert [c.id for c in await store.search_companies_by_name("gacy")] == [company_id]
+    assert (await store.get_person(person_id)).company_id == company_id
+    interactions = await store.get_interactions_by_participant(person_id)
+    assert [i.id for i in interactions] == [interaction_id]
+    assert interactions[0].metadata == {"subject": "hi"}
+    await store.close()
@@ -17,8 +17,7 @@ async def test_search_by_company(pipeline, storage, vector_store, embedding_serv
 
     # Find NovaBuild in the DB
     companies = await storage.search_companies_by_name("NovaBuild")
-    if not companies:
-        pytest.skip("NovaBuild not extracted by spaCy in this context")
+    assert companies
 
     retriever = Retriever(storage=storage, vector_store=vector_store, embedding_fn=embedding_service.embed)
     results = await retriever.search_by_company(companies[0].id)
@@ -34,8 +33,7 @@ async def test_search_by_person(pipeline, storage, vector_store, embedding_servi
     )
 
     people = await storage.search_people_by_name("Sarah Chen")
-    if not people:
-        pytest.skip("Sarah Chen not extracted by spaCy in this context")
+    assert people
 
     retriever = Retriever(storage=storage, vector_store=vector_store, embedding_fn=embedding_service.embed)
     results = await retriever.search_by_person(people[0].id)
@@ -54,3 +52,52 @@ async def test_semantic_search(pipeline, storage, vector_store, embedding_servic
     results = await retriever.semantic_search("enterprise tools")
     assert len(results) >= 1
     assert results[0].score > 0
+
+
+@pytest.mark.asyncio
+async def test_iter_search_by_company_pages_results(storage, vector_store):
+    from src.models import Chunk, Company
+
+    company = Company(name="PagedCorp")
+    await storage.save_company(company)
+    for i in range(5):
+        await storage.save_chunk(Chunk(
+            text=f"PagedCorp note {i}",
+            source_type=SourceType.DOCUMENT,
+            entity_ids=[company.id],
+        ))
+
+    retriever = Retriever(storage=storage, vector_store=vector_store)
+    batches = [b async for b in retriever.iter_search_by_company(company.id, limit=4, batch_size=2)]
+
+    assert [len(b) for b in batches] == [2, 2]
+    ids = {r.chunk.id for b in batches for r in b}
+    assert len(ids) == 4
+    assert all(r.company.name == "PagedCorp" for b in batches for r in b)
+
+
+@pytest.mark.asyncio
+async def test_semantic_search_many_embeds_queries_in_one_batch(pipeline, storage, vector_store, embedding_service):
+    await pipeline.ingest_interaction(
+        raw_text="NovaBuild's tools have strong adoption among enterprise teams.",
+        source_type=SourceType.MEETING_NOTES,
+        timestamp=datetime.utcnow(),
+    )
+
+    batches = []
+
+    async def embed_batch(texts):
+        batches.append(list(texts))
+        return await embedding_service.embed_batch(texts)
+
+    retriever = Retriever(
+        storage=storage,
+        vector_store=vector_store,
+        embedding_fn=embedding_service.embed,
+        embedding_batch_fn=embed_batch,
+    )
+    results = await retriever.semantic_search_many(["enterprise tools", "adoption"])
+
+    assert batches == [["enterprise tools", "adoption"]]
+    assert len(results) == 2
+    assert all(len(r) >= 1 for r in results)
@@ -5,25 +5,25 @@ import pytest
 from src.data.synthetic import SyntheticDataGenerator
 
 
-def test_generate_all_produces_correct_count():
-    gen = SyntheticDataGenerator()
-    items = gen.generate_all()
+@pytest.fixture(scope="module")
+def items():
+    """One generated item set, shared by the read-only shape tests."""
+    return SyntheticDataGenerator().generate_all()
+
+
+def test_generate_all_produces_correct_count(items):
     # 10 companies * 5 types = 50 items
     assert len(items) == 50
 
 
-def test_generate_all_has_all_types():
-    gen = SyntheticDataGenerator()
-    items = gen.generate_all()
+def test_generate_all_has_all_types(items):
     types = {item["type"] for item in items}
     assert "email" in types
     assert "meeting" in types
     assert "document" in types
 
 
-def test_generated_emails_have_required_fields():
-    gen = SyntheticDataGenerator()
-    items = gen.generate_all()
+def test_generated_emails_have_required_fields(items):
     emails = [i for i in items if i["type"] == "email"]
     for email in emails:
         assert "subject" in email
@@ -33,9 +33,7 @@ def test_generated_emails_have_required_fields():
         assert "timestamp" in email
 
 
-def test_generated_meetings_have_required_fields():
-    gen = SyntheticDataGenerator()
-    items = gen.generate_all()
+def test_generated_meetings_have_required_fields(items):
     meetings = [i for i in items if i["type"] == "meeting"]
     for meeting in meetings:
         assert "title" in meeting
@@ -49,3 +47,11 @@ async def test_seed_database(pipeline):
     gen = SyntheticDataGenerator()
     count = await gen.seed_database(pipeline)
     assert count == 50
+
+
+def test_generate_all_is_reproducible_with_seed():
+    def _bodies(seed):
+        items = SyntheticDataGenerator(seed=seed).generate_all()
+        return [item.get("body") or item.get("notes") or item.get("content") for item in items]
+
+    assert _bodies(42) == _bodies(42)
@@ -9,16 +9,18 @@ from src.storage.vector import VectorStore
 
 @pytest.mark.asyncio
 async def test_upsert_and_search(vector_store, embedding_service):
+    chunk_emb, query_emb = await embedding_service.embed_batch(
+        ["NovaBuild is an enterprise SaaS company", "enterprise software"]
+    )
     chunk = Chunk(
         text="NovaBuild is an enterprise SaaS company",
         source_id=uuid4(),
         source_type=SourceType.EMAIL,
         entity_ids=[uuid4()],
-        embedding=await embedding_service.embed("NovaBuild is an enterprise SaaS company"),
+        embedding=chunk_emb,
     )
     await vector_store.upsert(chunk)
 
-    query_emb = await embedding_service.embed("enterprise software")
     results = await vector_store.search(query_emb, limit=5)
 
     assert len(results) >= 1
@@ -37,34 +39,56 @@ async def test_upsert_requires_embedding(vector_store):
         await vector_store.upsert(chunk)
 
 
+@pytest.mark.asyncio
+async def test_upsert_many(vector_store, embedding_service):
+    texts = ["Fintech payments platform", "Construction management software"]
+    embeddings = await embedding_service.embed_batch(texts)
+    chunks = [
+        Chunk(text=t, source_id=uuid4(), source_type=SourceType.DOCUMENT, embedding=e)
+        for t, e in zip(texts, embeddings)
+    ]
+    await vector_store.upsert_many(chunks)
+
+    results = await vector_store.search(embeddings[1], limit=2)
+    assert {r.chunk.id for r in results} == {c.id for c in chunks}
+    assert results[0].chunk.id == chunks[1].id
+
+
 @pytest.mark.asyncio
 async def test_search_with_entity_filter(vector_store, embedding_service):
     entity_a = uuid4()
     entity_b = uuid4()
+    emb_a, emb_b, query_emb = await embedding_service.embed_batch([
+        "Company A builds developer tools",
+        "Company B builds fintech products",
+        "software tools",
+    ])
 
     chunk_a = Chunk(
         text="Company A builds developer tools",
         source_id=uuid4(),
         source_type=SourceType.EMAIL,
         entity_ids=[entity_a],
-        embedding=await embedding_service.embed("Company A builds developer tools"),
+        embedding=emb_a,
     )
     chunk_b = Chunk(
         text="Company B builds fintech products",
         source_id=uuid4(),
         source_type=SourceType.EMAIL,
         entity_ids=[entity_b],
-        embedding=await embedding_service.embed("Company B builds fintech products"),
+        embedding=emb_b,
     )
     await vector_store.upsert(chunk_a)
     await vector_store.upsert(chunk_b)
 
-    query_emb = await embedding_service.embed("software tools")
     results = await vector_store.search(query_emb, limit=5, filter_entity_ids=[entity_a])
 
     assert len(results) >= 1
     assert all(entity_a in r.chunk.entity_ids for r in results)
 
+    results = await vector_store.search(query_emb, limit=5, filter_entity_ids=[entity_a, entity_b])
+    assert {r.chunk.id for r in results} == {chunk_a.id, chunk_b.id}
+
 
 @pytest.mark.asyncio
 async def test_delete(vector_store, embedding_service):
@@ -80,3 +104,36 @@ async def test_delete(vector_store, embedding_service):
     query_emb = await embedding_service.embed("Delete me")
     results = await vector_store.search(query_emb, limit=5)
     assert all(r.chunk.id != chunk.id for r in results)
+
+
+def test_collection_uses_configured_hnsw_params(tmp_path):
+    from src.storage.vector import VectorStoreConfig
+
+    vs = VectorStore(VectorStoreConfig(
+        collection_name="hnsw_test",
+        persist_directory=str(tmp_path / "chroma"),
+        hnsw_m=24,
+        hnsw_search_ef=40,
+    ))
+    assert vs.collection.metadata["hnsw:M"] == 24
+    assert vs.collection.metadata["hnsw:search_ef"] == 40
+    assert vs.collection.metadata["hnsw:space"] == "cosine"
+
+
+@pytest.mark.asyncio
+async def test_search_returns_entity_types(vector_store, embedding_service):
+    from src.models import EntityType
+
+    company_id, person_id = uuid4(), uuid4()
+    await vector_store.upsert(Chunk(
+        text="typed chunk",
+        entity_ids=[company_id, person_id],
+        entity_types={company_id: EntityType.COMPANY, person_id: EntityType.PERSON},
+        embedding=await embedding_service.embed("typed chunk"),
+    ))
+
+    results = await vector_store.search(await embedding_service.embed("typed chunk"), limit=1)
+    assert results[0].chunk.entity_types == {
+        company_id: EntityType.COMPANY,
+        person_id: EntityType.PERSON,
+    }